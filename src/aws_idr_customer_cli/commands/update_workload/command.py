@@ -1,4 +1,5 @@
 import json
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 import click
@@ -76,8 +77,7 @@ class UpdateWorkload(CommandBase):
     ) -> Dict[str, Any]:
         """Execute workload update from config file."""
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
+            config = json.loads(Path(config_path).read_bytes())
         except json.JSONDecodeError as e:
             raise click.ClickException(f"Invalid JSON in config file: {e}")
         except FileNotFoundError:
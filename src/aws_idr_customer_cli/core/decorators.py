@@ -1,3 +1,4 @@
+import random
 import time
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Type, TypeVar
@@ -68,7 +69,12 @@ def argument(
 
 
 def retry_on_throttle(max_retries: int = 3, initial_backoff: float = 1.0) -> Callable:
-    """Retry decorator for handling throttling errors."""
+    """Retry decorator for handling throttling errors.
+
+    Backoff doubles on each attempt, plus up to ``initial_backoff`` seconds of
+    random jitter so concurrent callers throttled together do not retry in
+    lockstep.
+    """
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -79,7 +85,10 @@ def retry_on_throttle(max_retries: int = 3, initial_backoff: float = 1.0) -> Cal
                 except Exception as e:
                     if "Throttling" in str(e) or "Rate exceeded" in str(e):
                         if attempt < max_retries - 1:
-                            time.sleep(initial_backoff * (2**attempt))
+                            time.sleep(
+                                initial_backoff * (2**attempt)
+                                + random.uniform(0, initial_backoff)
+                            )
                             continue
                     raise
             return func(*args, **kwargs)
@@ -1,33 +1,38 @@
-from typing import Any, Callable, Dict, List, Optional
+from __future__ import annotations
+
+from concurrent.futures import as_completed
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from botocore.exceptions import ClientError
 from injector import inject
-from mypy_boto3_cloudwatch import CloudWatchClient
-from mypy_boto3_cloudwatch.type_defs import MetricAlarmTypeDef
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
+from aws_idr_customer_cli.utils.executor import SHARED_EXECUTOR
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
+if TYPE_CHECKING:
+    from mypy_boto3_cloudwatch import CloudWatchClient
+    from mypy_boto3_cloudwatch.type_defs import MetricAlarmTypeDef
+
+DESCRIBE_ALARMS_MAX_RECORDS = 100
+
 
 class AlarmAccessor(BaseAccessor):
     """Data accessor for CloudWatch alarms."""
 
-    MAX_RETRIES = 5
-
     @inject
     def __init__(
         self, logger: CliLogger, client_factory: Callable[[str, str], CloudWatchClient]
     ) -> None:
         super().__init__(logger, "CloudWatch API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.CLOUDWATCH.value
 
     def get_client(self, region: str) -> Any:
         """Get CloudWatch client for specified region using cached factory."""
-        return self.create_client(BotoServiceName.CLOUDWATCH, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def list_alarms_by_prefix(
         self, prefix: str, region: str
     ) -> List[MetricAlarmTypeDef]:
@@ -41,30 +46,62 @@ class AlarmAccessor(BaseAccessor):
         Returns:
             List of matching alarms
         """
-        try:
-            result = []
-            paginator = self.get_client(region).get_paginator("describe_alarms")
-            for page in paginator.paginate(AlarmNamePrefix=prefix):
-                if "MetricAlarms" in page:
-                    result.extend(page["MetricAlarms"])
+        with self._api_call("list_alarms_by_prefix"):
+            result: List[MetricAlarmTypeDef] = []
+            client = self.get_client(region)
+            # MaxRecords=100 is the API maximum (default is 50 per page)
+            kwargs: Dict[str, Any] = {
+                "AlarmNamePrefix": prefix,
+                "MaxRecords": DESCRIBE_ALARMS_MAX_RECORDS,
+            }
+            while True:
+                response = client.describe_alarms(**kwargs)
+                result.extend(response.get("MetricAlarms", []))
+                if "NextToken" not in response:
+                    break
+                kwargs["NextToken"] = response["NextToken"]
 
             self.logger.info(
-                f"Found {len(result)} alarms with prefix '{prefix}' in region '{region}'"
+                "Found %s alarms with prefix '%s' in region '%s'",
+                len(result),
+                prefix,
+                region,
             )
             return result
 
-        except ClientError as exception:
-            self._handle_error(exception, "list_alarms_by_prefix")
-            raise
-        except Exception as exception:
-            self.logger.error(
-                f"Unexpected error in list_alarms_by_prefix: {str(exception)}"
-            )
-            raise
+    def list_alarms_by_prefix_in_regions(
+        self, prefix: str, regions: Iterable[str]
+    ) -> Dict[str, List[MetricAlarmTypeDef]]:
+        """
+        List CloudWatch alarms by prefix in several regions concurrently.
+
+        Each region is paginated sequentially, but regions are fetched in
+        parallel so total latency is bounded by the slowest region rather
+        than the sum of all regions.
+
+        Args:
+            prefix: The prefix to filter alarms by
+            regions: AWS regions to query
+
+        Returns:
+            Mapping of region to the matching alarms in that region
+        """
+        regions = list(regions)
+        if len(regions) <= 1:
+            return {
+                region: self.list_alarms_by_prefix(prefix, region) for region in regions
+            }
+
+        alarms_by_region: Dict[str, List[MetricAlarmTypeDef]] = {}
+        future_to_region = {
+            SHARED_EXECUTOR.submit(self.list_alarms_by_prefix, prefix, region): region
+            for region in regions
+        }
+        for future in as_completed(future_to_region):
+            alarms_by_region[future_to_region[future]] = future.result()
+
+        return alarms_by_region
 
-    @retry(
-        exceptions=ClientError, tries=MAX_RETRIES, delay=1.0, backoff=2.0, logger=None
-    )
     def get_alarm_by_name(self, name: str, region: str) -> Optional[Any]:
         """
         Get alarm by exact name in specified region.
@@ -76,31 +113,49 @@ class AlarmAccessor(BaseAccessor):
         Returns:
             Alarm details
         """
-        try:
-            response = self.get_client(region).describe_alarms(AlarmNames=[name])
+        alarm = self.get_alarms_by_names([name], region).get(name)
+        if alarm:
+            self.logger.info("Found alarm '%s' in region '%s'", name, region)
+        else:
+            self.logger.info("Alarm '%s' not found in region '%s'", name, region)
+        return alarm
+
+    def get_alarms_by_names(
+        self, names: List[str], region: str
+    ) -> Dict[str, MetricAlarmTypeDef]:
+        """
+        Get metric alarms by exact name in specified region.
+
+        DescribeAlarms accepts up to 100 alarm names per request, so names
+        are resolved in batches of 100 rather than one request per name.
 
-            if "MetricAlarms" in response and response["MetricAlarms"]:
-                self.logger.info(f"Found alarm '{name}' in region '{region}'")
-                return response["MetricAlarms"][0]
-            else:
-                self.logger.info(f"Alarm '{name}' not found in region '{region}'")
-                return None
+        Args:
+            names: The exact alarm names to search for
+            region: AWS region to query
+
+        Returns:
+            Mapping of alarm name to alarm details; names that do not exist
+            are omitted
+        """
+        try:
+            client = self.get_client(region)
+            alarms: Dict[str, MetricAlarmTypeDef] = {}
+            for start in range(0, len(names), DESCRIBE_ALARMS_MAX_RECORDS):
+                response = client.describe_alarms(
+                    AlarmNames=names[start : start + DESCRIBE_ALARMS_MAX_RECORDS],
+                    MaxRecords=DESCRIBE_ALARMS_MAX_RECORDS,
+                )
+                for alarm in response.get("MetricAlarms", []):
+                    alarms[alarm["AlarmName"]] = alarm
+            return alarms
 
         except ClientError as exception:
             if exception.response["Error"]["Code"] == "ResourceNotFound":
-                self.logger.info(f"Alarm '{name}' not found in region '{region}'")
-                return None
-            self._handle_error(exception, "get_alarm_by_name")
-            raise
-        except Exception as exception:
-            self.logger.error(
-                f"Unexpected error in get_alarm_by_name: {str(exception)}"
-            )
+                self.logger.info("Alarms %s not found in region '%s'", names, region)
+                return {}
+            self._handle_error(exception, "get_alarms_by_names")
             raise
 
-    @retry(
-        exceptions=ClientError, tries=MAX_RETRIES, delay=1.0, backoff=2.0, logger=None
-    )
     def create_alarm(self, alarm_config: Dict[str, Any], region: str) -> None:
         """
         Create CloudWatch alarm using boto3 API in specified region.
@@ -113,13 +168,6 @@ class AlarmAccessor(BaseAccessor):
         Returns:
             None - Success is indicated by not raising an exception
         """
-        try:
+        with self._api_call("create_alarm"):
             client = self.get_client(region)
             client.put_metric_alarm(**alarm_config)
-
-        except ClientError as exception:
-            self._handle_error(exception, "create_alarm")
-            raise
-        except Exception as exception:
-            self.logger.error(f"Unexpected error in create_alarm: {str(exception)}")
-            raise
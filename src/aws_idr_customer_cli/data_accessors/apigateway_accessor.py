@@ -18,7 +18,9 @@ class ApiGatewayAccessor(BaseAccessor):
     def get_rest_api_name(self, api_id: str, region: str) -> Optional[str]:
         try:
             self.logger.debug(
-                f"Calling API Gateway GetRestApi API for API ID: {api_id} in region: {region}"
+                "Calling API Gateway GetRestApi API for API ID: %s in region: %s",
+                api_id,
+                region,
             )
             client = self.create_client("apigateway", region)
             response = client.get_rest_api(restApiId=api_id)
@@ -28,13 +30,16 @@ class ApiGatewayAccessor(BaseAccessor):
                 return str(name)
             else:
                 self.logger.warning(
-                    f"API Gateway GetRestApi returned no 'name' field for API ID: {api_id}"
+                    "API Gateway GetRestApi returned no 'name' field for API ID: %s",
+                    api_id,
                 )
                 return None
         except Exception as e:
             self.logger.warning(
-                f"Failed to call API Gateway GetRestApi for "
-                f"API ID {api_id} in region {region}: {str(e)}"
+                "Failed to call API Gateway GetRestApi for API ID %s in region %s: %s",
+                api_id,
+                region,
+                e,
             )
             return None
 
@@ -61,7 +66,9 @@ class ApiGatewayAccessor(BaseAccessor):
         """
         try:
             self.logger.debug(
-                f"Calling API Gateway V2 GetApi for API ID: {api_id} in region: {region}"
+                "Calling API Gateway V2 GetApi for API ID: %s in region: %s",
+                api_id,
+                region,
             )
             client = self.create_client("apigatewayv2", region)
             response = client.get_api(ApiId=api_id)
@@ -71,7 +78,8 @@ class ApiGatewayAccessor(BaseAccessor):
 
             if protocol_type is None:
                 self.logger.warning(
-                    f"API Gateway V2 GetApi returned no 'ProtocolType' for API ID: {api_id}"
+                    "API Gateway V2 GetApi returned no 'ProtocolType' for API ID: %s",
+                    api_id,
                 )
                 return None
 
@@ -82,7 +90,9 @@ class ApiGatewayAccessor(BaseAccessor):
             }
         except Exception as e:
             self.logger.warning(
-                f"Failed to call API Gateway V2 GetApi for "
-                f"API ID {api_id} in region {region}: {str(e)}"
+                "Failed to call API Gateway V2 GetApi for API ID %s in region %s: %s",
+                api_id,
+                region,
+                e,
             )
             return None
@@ -1,11 +1,94 @@
-from typing import Set
+import random
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Set, Tuple, TypeVar
+
+from botocore.exceptions import ClientError
 
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
+T = TypeVar("T")
+
+# AWS error codes that indicate a temporary condition worth retrying
+TRANSIENT_ERROR_CODES: FrozenSet[str] = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "ProvisionedThroughputExceededException",
+        "SlowDown",
+        "ServiceUnavailable",
+        "ServiceUnavailableException",
+        "InternalFailure",
+        "InternalError",
+        "InternalServerError",
+        "InternalServerException",
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "PriorRequestNotComplete",
+    }
+)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Return True if error is an AWS ClientError that is worth retrying."""
+    if not isinstance(error, ClientError):
+        return False
+    return error.response.get("Error", {}).get("Code") in TRANSIENT_ERROR_CODES
+
+
+def retry_on_transient_error(
+    tries: int = 5, delay: float = 1.0, backoff: float = 2.0, max_delay: float = 30.0
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Retry decorator that only retries transient AWS errors.
+
+    Throttling and service-side failures are retried with capped exponential
+    backoff plus up to ``delay`` seconds of random jitter, so concurrent
+    callers that were throttled together do not retry in lockstep. Any other
+    error, such as a validation or not-found error, is raised immediately
+    instead of being retried.
+
+    Only use it for clients built without AWS_CLIENT_CONFIG. Clients from
+    create_aws_client already retry in botocore's adaptive mode, and adding
+    this decorator on top would multiply the attempts.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            for attempt in range(tries - 1):
+                try:
+                    return func(*args, **kwargs)
+                except ClientError as error:
+                    if not is_transient_error(error):
+                        raise
+                    wait = min(max_delay, delay * backoff**attempt)
+                    time.sleep(wait + random.uniform(0, delay))
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 class BaseAccessor:
     """Base class for AWS service data accessors with common error handling."""
 
+    # Slotted so subclasses that also declare __slots__ carry no per-instance
+    # __dict__; subclasses without __slots__ keep working as before
+    __slots__ = (
+        "logger",
+        "service_name",
+        "_response_cache",
+        "_response_cache_lock",
+    )
+
     # Common AWS error codes that should be treated as validation errors
     VALIDATION_ERRORS: Set[str] = {
         "InvalidParameterException",
@@ -24,9 +107,45 @@ class BaseAccessor:
         "AuthorizationError",
     }
 
+    # How long describe-style responses are reused within a CLI session
+    RESPONSE_CACHE_TTL_SECONDS = 60.0
+
     def __init__(self, logger: CliLogger, service_name: str = "AWS API") -> None:
         self.logger = logger
         self.service_name = service_name
+        self._response_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._response_cache_lock = threading.Lock()
+
+    def _cached_response(self, key: Tuple[Any, ...], fetch: Callable[[], T]) -> T:
+        """Return the cached response for key, calling fetch on a miss or expiry.
+
+        Only successful responses are cached; exceptions from fetch propagate
+        and the next call retries the request.
+        """
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+        if entry is not None:
+            cached_at, value = entry
+            if time.monotonic() - cached_at < self.RESPONSE_CACHE_TTL_SECONDS:
+                return value  # type: ignore[no-any-return]
+
+        value = fetch()
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic(), value)
+        return value
+
+    @contextmanager
+    def _api_call(self, operation: str) -> Iterator[None]:
+        """Route AWS errors raised inside the block through _handle_error.
+
+        Other exceptions propagate unchanged and are reported by the CLI's
+        top-level handler.
+        """
+        try:
+            yield
+        except ClientError as error:
+            self._handle_error(error, operation)
+            raise
 
     def _handle_error(self, error: Exception, operation: str) -> None:
         """Handle common AWS service errors with consistent error mapping."""
@@ -37,10 +156,10 @@ class BaseAccessor:
 
         if error_code == "ValidationError" and operation == "describe_stacks":
             self.logger.debug(
-                f"Stack not found in {operation}: {error_code} - {str(error)}"
+                "Stack not found in %s: %s - %s", operation, error_code, error
             )
         else:
-            self.logger.error(f"Error in {operation}: {error_code} - {str(error)}")
+            self.logger.error("Error in %s: %s - %s", operation, error_code, error)
 
         if error_code in self.ACCESS_DENIED_ERRORS:
             raise PermissionError(f"Access denied to {self.service_name}: {str(error)}")
@@ -8,7 +8,6 @@ from mypy_boto3_cloudformation.type_defs import (
     ListStacksOutputTypeDef,
     ValidateTemplateOutputTypeDef,
 )
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.apm.apm_constants import (
@@ -39,25 +38,23 @@ DELETED_STACK_STATUS = "DELETE_COMPLETE"
 class CloudFormationAccessor(BaseAccessor):
     """Data accessor for CloudFormation operations with multi-region support."""
 
-    MAX_RETRIES = 5
-
     @inject
     def __init__(
         self, logger: CliLogger, client_factory: Callable[[str, str], Any]
     ) -> None:
         super().__init__(logger, "CloudFormation API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.CLOUDFORMATION.value
 
     def _get_client(self, region: str) -> Any:
         """Get CloudFormation client for specified region using cached factory."""
-        return self.create_client(BotoServiceName.CLOUDFORMATION, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def list_stacks(
         self, region: str, stack_status_filter: Optional[List[str]] = None
     ) -> ListStacksOutputTypeDef:
         """List CloudFormation stacks in specified region."""
-        try:
+        with self._api_call("list_stacks"):
             client = self._get_client(region=region)
             paginator = client.get_paginator("list_stacks")
             kwargs = {}
@@ -69,11 +66,7 @@ class CloudFormationAccessor(BaseAccessor):
                 stacks.extend(page.get("StackSummaries", []))
 
             return cast(ListStacksOutputTypeDef, {"StackSummaries": stacks})
-        except ClientError as exception:
-            self._handle_error(exception, "list_stacks")
-            raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def stack_exists(
         self, stack_name: str, region: str, exclude_deleted: bool = True
     ) -> bool:
@@ -101,7 +94,6 @@ class CloudFormationAccessor(BaseAccessor):
                 return False
             raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def deploy_stack(
         self,
         region: str,
@@ -117,7 +109,7 @@ class CloudFormationAccessor(BaseAccessor):
         if template_body and template_url:
             raise ValueError("Cannot specify both template_body and template_url")
 
-        try:
+        with self._api_call("deploy_stack"):
             client = self._get_client(region=region)
             create_params = {"StackName": stack_name, **kwargs}
 
@@ -140,16 +132,12 @@ class CloudFormationAccessor(BaseAccessor):
                 ]
 
             return cast(CreateStackOutputTypeDef, client.create_stack(**create_params))
-        except ClientError as exception:
-            self._handle_error(exception, "deploy_stack")
-            raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def describe_stacks(
         self, region: str, stack_name: Optional[str] = None
     ) -> DescribeStacksOutputTypeDef:
         """Describe CloudFormation stacks in specified region."""
-        try:
+        with self._api_call("describe_stacks"):
             client = self._get_client(region=region)
             if stack_name:
                 return cast(
@@ -162,11 +150,7 @@ class CloudFormationAccessor(BaseAccessor):
                 for page in paginator.paginate():
                     stacks.extend(page.get("Stacks", []))
                 return cast(DescribeStacksOutputTypeDef, {"Stacks": stacks})
-        except ClientError as exception:
-            self._handle_error(exception, "describe_stacks")
-            raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def wait_for_stack_create(
         self, stack_name: str, region: str, timeout: int = STACK_DEPLOYMENT_TIMEOUT
     ) -> Dict[str, Any]:
@@ -186,7 +170,7 @@ class CloudFormationAccessor(BaseAccessor):
             response = client.describe_stacks(StackName=stack_name)
             stack = response["Stacks"][0]
 
-            self.logger.info(f"Stack {stack_name} created successfully")
+            self.logger.info("Stack %s created successfully", stack_name)
             return {
                 "Status": stack["StackStatus"],
                 "Success": True,
@@ -204,7 +188,7 @@ class CloudFormationAccessor(BaseAccessor):
                 status = StackStatus.TIMEOUT.value
                 reason = f"Deployment timeout after {timeout} seconds"
 
-            self.logger.error(f"Stack {stack_name} failed: {reason}")
+            self.logger.error("Stack %s failed: %s", stack_name, reason)
             return {
                 "Status": status,
                 "Success": False,
@@ -215,7 +199,6 @@ class CloudFormationAccessor(BaseAccessor):
             self._handle_error(exception, "wait_for_stack_create")
             raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def validate_template(
         self,
         region: str,
@@ -228,7 +211,7 @@ class CloudFormationAccessor(BaseAccessor):
         if template_body and template_url:
             raise ValueError("Cannot specify both template_body and template_url")
 
-        try:
+        with self._api_call("validate_template"):
             client = self._get_client(region=region)
             params = {}
             if template_body:
@@ -239,11 +222,7 @@ class CloudFormationAccessor(BaseAccessor):
             return cast(
                 ValidateTemplateOutputTypeDef, client.validate_template(**params)
             )
-        except ClientError as exception:
-            self._handle_error(exception, "validate_template")
-            raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_stack_resources(self, stack_name: str, region: str) -> List[Dict[str, Any]]:
         """Get all resources created by the stack."""
         try:
@@ -258,7 +237,6 @@ class CloudFormationAccessor(BaseAccessor):
             self._handle_error(exception, "get_stack_resources")
             raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def delete_stack(self, stack_name: str, region: str) -> Dict[str, str]:
         """Delete CloudFormation stack and wait for completion."""
         try:
@@ -282,29 +260,23 @@ class CloudFormationAccessor(BaseAccessor):
                 }
             raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_stack_events(self, stack_name: str, region: str) -> List[Dict[str, Any]]:
         """Get stack events to identify failure reasons."""
-        try:
+        with self._api_call("get_stack_events"):
             client = self._get_client(region=region)
             response = client.describe_stack_events(StackName=stack_name)
             return cast(List[Dict[str, Any]], response.get("StackEvents", []))
-        except ClientError as exception:
-            self._handle_error(exception, "get_stack_events")
-            raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def update_termination_protection(
         self, stack_name: str, region: str, enable: bool
     ) -> None:
         """Update termination protection for a CloudFormation stack."""
-        try:
+        with self._api_call("update_termination_protection"):
             client = self._get_client(region=region)
             client.update_termination_protection(
                 StackName=stack_name, EnableTerminationProtection=enable
             )
             status = "enabled" if enable else "disabled"
-            self.logger.info(f"Termination protection {status} for stack {stack_name}")
-        except ClientError as exception:
-            self._handle_error(exception, "update_termination_protection")
-            raise
+            self.logger.info(
+                "Termination protection %s for stack %s", status, stack_name
+            )
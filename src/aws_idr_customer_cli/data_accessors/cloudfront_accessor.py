@@ -4,13 +4,13 @@ from typing import Any, Callable, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 from injector import inject
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
 CLOUDFRONT_REGION = "us-east-1"  # CloudFront is global, use us-east-1 endpoint
+LIST_DISTRIBUTIONS_MAX_ITEMS = "1000"  # API expects a string
 
 
 class CloudFrontAccessor(BaseAccessor):
@@ -20,8 +20,6 @@ class CloudFrontAccessor(BaseAccessor):
     Business logic such as Lambda@Edge detection is handled by separate services.
     """
 
-    MAX_RETRIES = 3
-
     @inject
     def __init__(
         self,
@@ -36,12 +34,12 @@ class CloudFrontAccessor(BaseAccessor):
         """
         super().__init__(logger, "CloudFront API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.CLOUDFRONT.value
 
     def _get_client(self) -> Any:
         """Get CloudFront client for us-east-1 region."""
-        return self.create_client(BotoServiceName.CLOUDFRONT, CLOUDFRONT_REGION)
+        return self.create_client(self._service_name, CLOUDFRONT_REGION)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def list_distributions(self) -> List[Dict[str, Any]]:
         """List all CloudFront distributions.
 
@@ -51,25 +49,23 @@ class CloudFrontAccessor(BaseAccessor):
         Raises:
             ClientError: If API call fails
         """
-        try:
+        with self._api_call("list_distributions"):
             client = self._get_client()
             distributions: List[Dict[str, Any]] = []
 
-            paginator = client.get_paginator("list_distributions")
-
-            for page in paginator.paginate():
-                dist_list = page.get("DistributionList", {})
-                items = dist_list.get("Items", [])
-                distributions.extend(items)
-
-            self.logger.info(f"Found {len(distributions)} CloudFront distributions")
+            kwargs: Dict[str, Any] = {"MaxItems": LIST_DISTRIBUTIONS_MAX_ITEMS}
+            while True:
+                dist_list = client.list_distributions(**kwargs).get(
+                    "DistributionList", {}
+                )
+                distributions.extend(dist_list.get("Items", []))
+                if not dist_list.get("IsTruncated"):
+                    break
+                kwargs["Marker"] = dist_list["NextMarker"]
+
+            self.logger.info("Found %s CloudFront distributions", len(distributions))
             return distributions
 
-        except ClientError as exception:
-            self._handle_error(exception, "list_distributions")
-            raise
-
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_distribution(self, dist_id: str) -> Optional[Dict[str, Any]]:
         """Get CloudFront distribution configuration.
 
@@ -81,14 +77,17 @@ class CloudFrontAccessor(BaseAccessor):
         """
         try:
             client = self._get_client()
-            response = client.get_distribution(Id=dist_id)
+            response = self._cached_response(
+                ("get_distribution", dist_id),
+                lambda: client.get_distribution(Id=dist_id),
+            )
             return dict(response.get("Distribution", {}))  # type: ignore[arg-type]
 
         except ClientError as exception:
             error_code = exception.response.get("Error", {}).get("Code", "")
 
             if error_code == "NoSuchDistribution":
-                self.logger.warning(f"CloudFront distribution not found: {dist_id}")
+                self.logger.warning("CloudFront distribution not found: %s", dist_id)
                 return None
 
             self._handle_error(exception, "get_distribution")
@@ -1,40 +1,51 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from __future__ import annotations
+
+import threading
+from concurrent.futures import as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from botocore.exceptions import ClientError
 from injector import inject
-from mypy_boto3_cloudwatch import CloudWatchClient
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
-from aws_idr_customer_cli.utils.constants import MAX_PARALLEL_WORKERS, BotoServiceName
+from aws_idr_customer_cli.utils.constants import BotoServiceName
+from aws_idr_customer_cli.utils.executor import SHARED_EXECUTOR
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 from aws_idr_customer_cli.utils.region_utils import get_valid_regions
 
+if TYPE_CHECKING:
+    from mypy_boto3_cloudwatch import CloudWatchClient
+
 DEFAULT_LAMBDA_INVOCATION_LOOKBACK_MINUTES = 5
 LAMBDA_INVOCATION_METRIC_PERIOD_SECONDS = 60
+# ListMetrics can restrict results to metrics with data points in the past
+# three hours; this is the only supported value for RecentlyActive.
+LIST_METRICS_RECENTLY_ACTIVE = "PT3H"
+LIST_METRICS_RECENTLY_ACTIVE_MINUTES = 180
+# Upper bound on in-flight CloudWatch requests from region scans, independent
+# of how many workers the shared executor has
+CLOUDWATCH_MAX_CONCURRENT_REQUESTS = 8
 
 
 class CloudWatchMetricsAccessor(BaseAccessor):
     """Data accessor for CloudWatch metrics operations."""
 
-    MAX_RETRIES = 5
-
     @inject
     def __init__(
         self, logger: CliLogger, client_factory: Callable[[str, str], CloudWatchClient]
     ) -> None:
         super().__init__(logger, "CloudWatch Metrics API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.CLOUDWATCH.value
+        self._lambda_metric_exists: Dict[Tuple[str, str], bool] = {}
+        self._request_semaphore = threading.BoundedSemaphore(
+            CLOUDWATCH_MAX_CONCURRENT_REQUESTS
+        )
 
     def get_client(self, region: str) -> Any:
         """Get CloudWatch client for specified region using cached factory."""
-        return self.create_client(BotoServiceName.CLOUDWATCH, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(
-        exceptions=ClientError, tries=MAX_RETRIES, delay=1.0, backoff=2.0, logger=None
-    )
     def list_metrics_by_namespace(
         self, namespace: str, region: str
     ) -> List[Dict[str, Any]]:
@@ -48,29 +59,25 @@ class CloudWatchMetricsAccessor(BaseAccessor):
         Returns:
             List of metrics in the namespace
         """
-        try:
-            result = []
-            paginator = self.get_client(region).get_paginator("list_metrics")
-            for page in paginator.paginate(Namespace=namespace):
-                if "Metrics" in page:
-                    result.extend(page["Metrics"])
+        with self._api_call("list_metrics_by_namespace"):
+            result: List[Dict[str, Any]] = []
+            client = self.get_client(region)
+            kwargs: Dict[str, Any] = {"Namespace": namespace}
+            while True:
+                response = client.list_metrics(**kwargs)
+                result.extend(response.get("Metrics", []))
+                if "NextToken" not in response:
+                    break
+                kwargs["NextToken"] = response["NextToken"]
 
             self.logger.info(
-                f"Found {len(result)} metrics in namespace "
-                f"'{namespace}' in region '{region}'"
+                "Found %s metrics in namespace '%s' in region '%s'",
+                len(result),
+                namespace,
+                region,
             )
             return result
 
-        except ClientError as exception:
-            self._handle_error(exception, "list_metrics_by_namespace")
-            raise
-        except Exception as exception:
-            self.logger.error(
-                f"Unexpected error in list_metrics_by_namespace: {str(exception)}"
-            )
-            raise
-
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def validate_invoked_lambda(
         self,
         function_name: str,
@@ -95,16 +102,11 @@ class CloudWatchMetricsAccessor(BaseAccessor):
         Returns:
             True if function has recent invocations, False otherwise
         """
-        try:
-            # Format function name for Lambda@Edge metrics
+        with self._api_call("validate_invoked_lambda"):
             # Lambda@Edge always uses prefixed format in ALL regions
-            query_function_name = function_name
-            if is_lambda_edge:
-                query_function_name = f"us-east-1.{function_name}"
-                self.logger.debug(
-                    f"Formatted Lambda@Edge function name for region "
-                    f"{region}: {query_function_name}"
-                )
+            query_function_name = (
+                f"us-east-1.{function_name}" if is_lambda_edge else function_name
+            )
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(minutes=lookback_minutes)
@@ -137,30 +139,70 @@ class CloudWatchMetricsAccessor(BaseAccessor):
                 values = result.get("Values", [])
                 if values and sum(values) > 0:
                     self.logger.info(
-                        f"Lambda {function_name} has recent invocations "
-                        f"in region {region}"
+                        "Lambda %s has recent invocations in region %s",
+                        function_name,
+                        region,
                     )
                     return True
 
             self.logger.debug(
-                f"No recent invocations for Lambda {function_name} "
-                f"in region {region}"
+                "No recent invocations for Lambda %s in region %s",
+                function_name,
+                region,
             )
             return False
 
-        except ClientError as exception:
-            self._handle_error(exception, "validate_invoked_lambda")
-            raise
-        except Exception as exception:
-            self.logger.error(
-                f"Unexpected error in validate_invoked_lambda: {str(exception)}"
-            )
-            raise
+    def has_lambda_invocation_metric(
+        self,
+        function_name: str,
+        region: str,
+        lookback_minutes: int = DEFAULT_LAMBDA_INVOCATION_LOOKBACK_MINUTES,
+        is_lambda_edge: bool = False,
+    ) -> bool:
+        """
+        Check whether a Lambda Invocations metric exists in a region.
+
+        Uses ListMetrics as a cheap pre-filter ahead of GetMetricData: most
+        regions have no metric at all for a given function, and ListMetrics
+        answers that without retrieving any data points. When the lookback
+        fits within three hours, only recently active metrics are listed.
+        Results are cached per (region, function name) for the process.
+
+        Args:
+            function_name: Lambda function name (raw name, without the
+                Lambda@Edge prefix)
+            region: AWS region to query
+            lookback_minutes: How far back invocations are being checked
+            is_lambda_edge: Whether this is a Lambda@Edge function
+
+        Returns:
+            True if the metric exists in the region, False otherwise
+        """
+        query_function_name = (
+            f"us-east-1.{function_name}" if is_lambda_edge else function_name
+        )
+        cache_key = (region, query_function_name)
+        if cache_key in self._lambda_metric_exists:
+            return self._lambda_metric_exists[cache_key]
+
+        with self._api_call("has_lambda_invocation_metric"):
+            kwargs: Dict[str, Any] = {
+                "Namespace": "AWS/Lambda",
+                "MetricName": "Invocations",
+                "Dimensions": [{"Name": "FunctionName", "Value": query_function_name}],
+            }
+            if lookback_minutes <= LIST_METRICS_RECENTLY_ACTIVE_MINUTES:
+                kwargs["RecentlyActive"] = LIST_METRICS_RECENTLY_ACTIVE
+
+            response = self.get_client(region).list_metrics(**kwargs)
+            exists = bool(response.get("Metrics"))
+            self._lambda_metric_exists[cache_key] = exists
+            return exists
 
     def find_regions_with_lambda_metrics(
         self,
         function_name: str,
-        regions: Optional[List[str]] = None,
+        regions: Optional[Sequence[str]] = None,
         lookback_minutes: int = DEFAULT_LAMBDA_INVOCATION_LOOKBACK_MINUTES,
         is_lambda_edge: bool = False,
     ) -> List[str]:
@@ -175,8 +217,10 @@ class CloudWatchMetricsAccessor(BaseAccessor):
         prefixed format "us-east-1.{functionName}" in ALL regions, including
         us-east-1 itself.
 
-        This method uses ThreadPoolExecutor to check multiple regions
-        concurrently, significantly improving performance
+        This method uses the shared thread pool to check multiple regions
+        concurrently, significantly improving performance. Regions without
+        the metric are skipped via a ListMetrics pre-filter before any
+        GetMetricData call is made.
 
         Args:
             function_name: Lambda function name (raw name, without us-east-1
@@ -194,8 +238,14 @@ class CloudWatchMetricsAccessor(BaseAccessor):
             regions = get_valid_regions()
 
         self.logger.info(
-            f"Scanning {len(regions)} regions for Lambda@Edge "
-            f"metrics for function: {function_name}"
+            "Scanning %s regions for Lambda@Edge metrics for function: %s",
+            len(regions),
+            function_name,
+        )
+
+        # Resolve the metric dimension value once instead of in every worker
+        query_function_name = (
+            f"us-east-1.{function_name}" if is_lambda_edge else function_name
         )
 
         def check_region(region: str) -> Optional[str]:
@@ -209,37 +259,42 @@ class CloudWatchMetricsAccessor(BaseAccessor):
                 Region name if metrics found, None otherwise
             """
             try:
-                if self.validate_invoked_lambda(
-                    function_name, region, lookback_minutes, is_lambda_edge
-                ):
+                with self._request_semaphore:
+                    if not self.has_lambda_invocation_metric(
+                        query_function_name, region, lookback_minutes
+                    ):
+                        return None
+                    invoked = self.validate_invoked_lambda(
+                        query_function_name, region, lookback_minutes
+                    )
+                if invoked:
                     self.logger.debug(
-                        f"Found metrics for {function_name} in region {region}"
+                        "Found metrics for %s in region %s", function_name, region
                     )
                     return region
             except Exception as e:
                 # Log but continue
                 self.logger.debug(
-                    f"Error checking region {region} for "
-                    f"Lambda@Edge metrics: {str(e)}"
+                    "Error checking region %s for Lambda@Edge metrics: %s",
+                    region,
+                    e,
                 )
             return None
 
         regions_with_metrics: List[str] = []
 
-        # Conservative worker count to avoid API throttling
-        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_WORKERS) as executor:
-            future_to_region = {
-                executor.submit(check_region, region): region for region in regions
-            }
-
-            for future in as_completed(future_to_region):
-                result = future.result()
-                if result:
-                    regions_with_metrics.append(result)
+        # Shared executor keeps a conservative worker count to avoid throttling
+        futures = [SHARED_EXECUTOR.submit(check_region, region) for region in regions]
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                regions_with_metrics.append(result)
 
         self.logger.info(
-            f"Found Lambda@Edge metrics in {len(regions_with_metrics)} "
-            f"regions for function {function_name}: {regions_with_metrics}"
+            "Found Lambda@Edge metrics in %s regions for function %s: %s",
+            len(regions_with_metrics),
+            function_name,
+            regions_with_metrics,
         )
 
         return regions_with_metrics
@@ -1,41 +1,42 @@
-from typing import Any, Callable, cast
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
 
-from botocore.exceptions import ClientError
 from injector import inject
-from mypy_boto3_dynamodb.type_defs import TableDescriptionTypeDef
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.type_defs import TableDescriptionTypeDef
+
 
 class DynamoDbAccessor(BaseAccessor):
     """Data accessor for DynamoDB operations with multi-region support."""
 
-    MAX_RETRIES = 5
-
     @inject
     def __init__(
         self, logger: CliLogger, client_factory: Callable[[str, str], Any]
     ) -> None:
         super().__init__(logger, "DynamoDB API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.DYNAMODB.value
 
     def _get_client(self, region: str) -> Any:
         """Get DynamoDB client for specified region using cached factory."""
-        return self.create_client(BotoServiceName.DYNAMODB, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def describe_table(self, table_name: str, region: str) -> TableDescriptionTypeDef:
-        """Describe DynamoDB table."""
-        try:
+        """Describe DynamoDB table.
+
+        Raises KeyError if the response is missing the Table field.
+        """
+        with self._api_call("describe_table"):
             client = self._get_client(region)
-            response = client.describe_table(TableName=table_name)
-            return cast(TableDescriptionTypeDef, response.get("Table", {}))
-        except ClientError as exception:
-            self._handle_error(exception, "describe_table")
-            raise
-        except Exception as exception:
-            self.logger.error(f"Unexpected error in describe_table: {str(exception)}")
-            raise
+            response = self._cached_response(
+                ("describe_table", table_name, region),
+                lambda: client.describe_table(TableName=table_name),
+            )
+            table: TableDescriptionTypeDef = response["Table"]
+            return table
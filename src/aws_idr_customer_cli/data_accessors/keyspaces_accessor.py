@@ -1,45 +1,40 @@
-from typing import Any, Callable, cast
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
 
-from botocore.exceptions import ClientError
 from injector import inject
-from mypy_boto3_keyspaces.type_defs import GetKeyspaceResponseTypeDef
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
+if TYPE_CHECKING:
+    from mypy_boto3_keyspaces.type_defs import GetKeyspaceResponseTypeDef
+
 
 class KeyspacesAccessor(BaseAccessor):
     """Data accessor for Keyspaces operations with multi-region support."""
 
-    MAX_RETRIES = 5
-
     @inject
     def __init__(
         self, logger: CliLogger, client_factory: Callable[[str, str], Any]
     ) -> None:
         super().__init__(logger, "Keyspaces API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.KEYSPACES.value
 
     def _get_client(self, region: str) -> Any:
         """Get Keyspaces client for specified region using cached factory."""
-        return self.create_client(BotoServiceName.KEYSPACES, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_keyspace(
         self, keyspace_name: str, region: str
     ) -> GetKeyspaceResponseTypeDef:
         """Get Keyspaces keyspace details."""
-        try:
+        with self._api_call("get_keyspace"):
             client = self._get_client(region)
-            return cast(
-                GetKeyspaceResponseTypeDef,
-                client.get_keyspace(keyspaceName=keyspace_name),
+            keyspace: GetKeyspaceResponseTypeDef = self._cached_response(
+                ("get_keyspace", keyspace_name, region),
+                lambda: client.get_keyspace(keyspaceName=keyspace_name),
             )
-        except ClientError as exception:
-            self._handle_error(exception, "get_keyspace")
-            raise
-        except Exception as exception:
-            self.logger.error(f"Unexpected error in get_keyspace: {str(exception)}")
-            raise
+            return keyspace
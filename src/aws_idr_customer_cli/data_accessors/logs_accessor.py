@@ -3,7 +3,6 @@ from typing import Any, Callable, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 from injector import inject
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
@@ -15,20 +14,18 @@ DEFAULT_LOOKBACK_MINUTES = 10
 class LogsAccessor(BaseAccessor):
     """Data accessor for CloudWatch Logs."""
 
-    MAX_RETRIES = 5
-
     @inject
     def __init__(
         self, logger: CliLogger, client_factory: Callable[[str, str], Any]
     ) -> None:
         super().__init__(logger, "CloudWatch Logs API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.LOGS.value
 
     def get_client(self, region: str) -> Any:
         """Get CloudWatch Logs client for specified region."""
-        return self.create_client(BotoServiceName.LOGS, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_log_events(
         self,
         log_group_name: str,
@@ -68,7 +65,7 @@ class LogsAccessor(BaseAccessor):
 
             events: List[Dict[str, Any]] = response.get("events", [])
             self.logger.info(
-                f"Retrieved {len(events)} log events from {log_group_name}"
+                "Retrieved %s log events from %s", len(events), log_group_name
             )
             return events
 
@@ -76,16 +73,13 @@ class LogsAccessor(BaseAccessor):
             error_code = exception.response["Error"]["Code"]
             if error_code == "ResourceNotFoundException":
                 self.logger.info(
-                    f"Log group '{log_group_name}' not found in region '{region}'"
+                    "Log group '%s' not found in region '%s'", log_group_name, region
                 )
                 return []
             elif error_code == "InvalidParameterException":
                 self.logger.error(
-                    f"Invalid parameters for log group '{log_group_name}'"
+                    "Invalid parameters for log group '%s'", log_group_name
                 )
                 raise
             self._handle_error(exception, "get_log_events")
             raise
-        except Exception as exception:
-            self.logger.error(f"Unexpected error in get_log_events: {str(exception)}")
-            raise
@@ -2,9 +2,7 @@
 
 from typing import Any, Callable
 
-from botocore.exceptions import ClientError
 from injector import inject
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
@@ -17,8 +15,6 @@ class OpenSearchAccessor(BaseAccessor):
     Provides methods to query OpenSearch domain configuration.
     """
 
-    MAX_RETRIES = 5
-
     @inject
     def __init__(
         self, logger: CliLogger, client_factory: Callable[[str, str], Any]
@@ -31,6 +27,7 @@ class OpenSearchAccessor(BaseAccessor):
         """
         super().__init__(logger, "OpenSearch API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.OPENSEARCH.value
 
     def _get_client(self, region: str) -> Any:
         """Get OpenSearch client for specified region using cached factory.
@@ -41,9 +38,8 @@ class OpenSearchAccessor(BaseAccessor):
         Returns:
             Boto3 OpenSearch client
         """
-        return self.create_client(BotoServiceName.OPENSEARCH, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def describe_domain(self, domain_name: str, region: str) -> dict[str, Any]:
         """Describe OpenSearch domain to get configuration details.
 
@@ -60,14 +56,8 @@ class OpenSearchAccessor(BaseAccessor):
             PermissionError: If access to the domain is denied
             ClientError: For other AWS API errors
         """
-        try:
+        with self._api_call("describe_domain"):
             client = self._get_client(region)
             response = client.describe_domain(DomainName=domain_name)
             domain_status: dict[str, Any] = response.get("DomainStatus", {})
             return domain_status
-        except ClientError as exception:
-            self._handle_error(exception, "describe_domain")
-            raise
-        except Exception as exception:
-            self.logger.error(f"Unexpected error in describe_domain: {str(exception)}")
-            raise
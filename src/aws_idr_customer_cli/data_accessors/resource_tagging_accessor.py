@@ -1,9 +1,7 @@
 from typing import Any, Callable, Dict, List, Optional, cast
 
-from botocore.exceptions import ClientError
 from injector import inject
 from mypy_boto3_resourcegroupstaggingapi.type_defs import ResourceTagMappingTypeDef
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
@@ -15,7 +13,6 @@ class ResourceTaggingAccessor(BaseAccessor):
 
     MAX_RESOURCES_PER_PAGE = 100
     MAX_RESOURCE_TYPES_PER_CALL = 100  # RGTA API limit
-    MAX_RETRIES = 5
 
     @inject
     def __init__(
@@ -23,10 +20,11 @@ class ResourceTaggingAccessor(BaseAccessor):
     ) -> None:
         super().__init__(logger, "Resource Groups Tagging API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.RESOURCE_GROUPS_TAGGING.value
 
     def _get_client(self, region: str) -> Any:
         """Get client using cached factory - no instance caching needed."""
-        return self.create_client(BotoServiceName.RESOURCE_GROUPS_TAGGING, region)
+        return self.create_client(self._service_name, region)
 
     def _batch_rgta_resource_types(
         self, resource_types: List[str], batch_size: int = 100
@@ -80,7 +78,7 @@ class ResourceTaggingAccessor(BaseAccessor):
         kwargs["ResourcesPerPage"] = resources_per_page
         kwargs["IncludeComplianceDetails"] = False
 
-        self.logger.debug(f"Calling RGTA client paginator with filter: {tag_filters}")
+        self.logger.debug("Calling RGTA client paginator with filter: %s", tag_filters)
         page_iterator = paginator.paginate(**kwargs)
 
         for page in page_iterator:
@@ -89,7 +87,6 @@ class ResourceTaggingAccessor(BaseAccessor):
 
         return resources
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_resources(
         self,
         region: str,
@@ -114,7 +111,7 @@ class ResourceTaggingAccessor(BaseAccessor):
             List of resources with their tags, combined from all batched calls
             if necessary
         """
-        try:
+        with self._api_call("get_resources"):
             if resource_types is None or len(resource_types) == 0:
                 batches: List[Optional[List[str]]] = [resource_types]
             else:
@@ -124,8 +121,9 @@ class ResourceTaggingAccessor(BaseAccessor):
                 )
                 if len(batches) > 1:
                     self.logger.info(
-                        f"Batching {len(resource_types)} resource types into "
-                        f"{len(batches)} RGTA calls"
+                        "Batching %s resource types into %s RGTA calls",
+                        len(resource_types),
+                        len(batches),
                     )
 
             all_resources = []
@@ -134,8 +132,10 @@ class ResourceTaggingAccessor(BaseAccessor):
                 if len(batches) > 1:
                     batch_size = len(batch) if batch else 0
                     self.logger.debug(
-                        f"Processing batch {batch_idx}/{len(batches)} with "
-                        f"{batch_size} resource types"
+                        "Processing batch %s/%s with %s resource types",
+                        batch_idx,
+                        len(batches),
+                        batch_size,
                     )
 
                 try:
@@ -149,26 +149,19 @@ class ResourceTaggingAccessor(BaseAccessor):
                 except Exception as e:
                     # Fail fast on any batch error
                     if len(batches) > 1:
-                        self.logger.error(f"Error in batch {batch_idx}: {str(e)}")
+                        self.logger.error("Error in batch %s: %s", batch_idx, e)
                     raise e
 
             if len(batches) > 1:
                 self.logger.info(
-                    f"Retrieved {len(all_resources)} resources from "
-                    f"{len(batches)} batched calls"
+                    "Retrieved %s resources from %s batched calls",
+                    len(all_resources),
+                    len(batches),
                 )
             else:
-                self.logger.info(f"Retrieved {len(all_resources)} resources")
+                self.logger.info("Retrieved %s resources", len(all_resources))
             return all_resources
 
-        except ClientError as exception:
-            super()._handle_error(exception, "get_resources")
-            raise
-        except Exception as exception:
-            self.logger.error(f"Unexpected error in get_resources: {str(exception)}")
-            raise
-
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_tag_keys(self) -> List[str]:
         """
         Get all tag keys used in the account. Not used in Beta. Placeholder only
@@ -181,7 +174,6 @@ class ResourceTaggingAccessor(BaseAccessor):
         """
         return []
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_tag_values(self, key: str) -> List[str]:
         """
         Get all values for a specific tag key. Not used in Beta. Placeholder only
@@ -1,9 +1,9 @@
-from typing import Any, Callable, List, cast
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from botocore.exceptions import ClientError
 from injector import inject
 from mypy_boto3_s3.type_defs import MetricsConfigurationTypeDef
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName, Region
@@ -13,7 +13,12 @@ from aws_idr_customer_cli.utils.log_handlers import CliLogger
 class S3Accessor(BaseAccessor):
     """Data accessor for S3 operations with multi-region support."""
 
-    MAX_RETRIES = 5
+    __slots__ = (
+        "create_client",
+        "_service_name",
+        "_bucket_regions",
+        "_bucket_regions_lock",
+    )
 
     @inject
     def __init__(
@@ -23,41 +28,77 @@ class S3Accessor(BaseAccessor):
     ) -> None:
         super().__init__(logger, "S3 API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.S3.value
+        self._bucket_regions: Dict[str, str] = {}
+        self._bucket_regions_lock = threading.Lock()
 
     def _get_client(self, region: str) -> Any:
         """Get S3 client for specified region using cached factory."""
-        return self.create_client(BotoServiceName.S3, region)
+        return self.create_client(self._service_name, region)
 
     def get_bucket_location(self, bucket_name: str) -> str:
-        """Get the region where a bucket is located."""
-        try:
+        """Get the region where a bucket is located.
+
+        Bucket regions never change, so results are cached per bucket for
+        the life of the accessor.
+        """
+        with self._bucket_regions_lock:
+            cached = self._bucket_regions.get(bucket_name)
+        if cached:
+            return cached
+
+        with self._api_call("get_bucket_location"):
             client = self._get_client(str(Region.US_EAST_1.value))
-            response = client.get_bucket_location(Bucket=bucket_name)
-            return response.get("LocationConstraint") or str(Region.US_EAST_1.value)
+            region = self._head_bucket_region(client, bucket_name)
+            if not region:
+                response = client.get_bucket_location(Bucket=bucket_name)
+                region = response.get("LocationConstraint") or str(
+                    Region.US_EAST_1.value
+                )
+
+        with self._bucket_regions_lock:
+            self._bucket_regions[bucket_name] = region
+        return region
+
+    @staticmethod
+    def _head_bucket_region(client: Any, bucket_name: str) -> Optional[str]:
+        """Read the bucket region from the x-amz-bucket-region header.
+
+        S3 returns this header on HeadBucket responses, including redirect and
+        access-denied errors, so one request usually answers the question.
+        Returns None when the header is missing so callers can fall back to
+        GetBucketLocation.
+        """
+        try:
+            response = client.head_bucket(Bucket=bucket_name)
         except ClientError as e:
-            self._handle_error(e, "get_bucket_location")
-            raise
+            response = e.response
+        headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+        region: Optional[str] = headers.get("x-amz-bucket-region")
+        return region
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def list_bucket_metrics_configurations(
         self, bucket_name: str, region: str
     ) -> List[MetricsConfigurationTypeDef]:
         """List S3 bucket metrics configurations."""
-        try:
+        return list(self.iter_bucket_metrics_configurations(bucket_name, region))
+
+    def iter_bucket_metrics_configurations(
+        self, bucket_name: str, region: str
+    ) -> Iterator[MetricsConfigurationTypeDef]:
+        """Yield S3 bucket metrics configurations one page at a time.
+
+        Pages are requested lazily, so callers that only need to know whether
+        any configuration exists can stop after the first item.
+        """
+        with self._api_call("list_bucket_metrics_configurations"):
             if region == "global":
                 region = self.get_bucket_location(bucket_name)
             client = self._get_client(region)
-            response = client.list_bucket_metrics_configurations(Bucket=bucket_name)
-            return cast(
-                List[MetricsConfigurationTypeDef],
-                response.get("MetricsConfigurationList", []),
-            )
-        except ClientError as exception:
-            self._handle_error(exception, "list_bucket_metrics_configurations")
-            raise
-        except Exception as exception:
-            self.logger.error(
-                f"Unexpected error in list_bucket_metrics_configurations: "
-                f"{str(exception)}"
-            )
-            raise
+            kwargs: Dict[str, Any] = {"Bucket": bucket_name}
+            while True:
+                response = client.list_bucket_metrics_configurations(**kwargs)
+                yield from response.get("MetricsConfigurationList", [])
+                if not response.get("IsTruncated"):
+                    break
+                kwargs["ContinuationToken"] = response["NextContinuationToken"]
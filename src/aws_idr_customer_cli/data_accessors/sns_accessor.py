@@ -1,23 +1,24 @@
-from typing import Any, Callable, Dict, cast
+from concurrent.futures import as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator
 
-from botocore.exceptions import ClientError
 from injector import inject
 from mypy_boto3_sns.type_defs import (
     GetTopicAttributesResponseTypeDef,
     ListSubscriptionsByTopicResponseTypeDef,
     ListTopicsResponseTypeDef,
+    SubscriptionTypeDef,
 )
-from retry import retry
 
 from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
 from aws_idr_customer_cli.utils.constants import BotoServiceName
+from aws_idr_customer_cli.utils.executor import SHARED_EXECUTOR
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
 
 class SnsAccessor(BaseAccessor):
     """Data accessor for SNS operations with multi-region support."""
 
-    MAX_RETRIES = 5
+    __slots__ = ("create_client", "_service_name")
 
     @inject
     def __init__(
@@ -25,82 +26,81 @@ class SnsAccessor(BaseAccessor):
     ) -> None:
         super().__init__(logger, "SNS API")
         self.create_client = client_factory
+        self._service_name = BotoServiceName.SNS.value
 
     def _get_client(self, region: str) -> Any:
         """Get SNS client for specified region using cached factory."""
-        return self.create_client(BotoServiceName.SNS, region)
+        return self.create_client(self._service_name, region)
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def list_topics(self, region: str) -> ListTopicsResponseTypeDef:
         """List SNS topics in specified region."""
-        try:
-            client = self._get_client(region)
-            paginator = client.get_paginator("list_topics")
-
-            topics = []
-            for page in paginator.paginate():
-                topics.extend(page.get("Topics", []))
-
-            return cast(ListTopicsResponseTypeDef, {"Topics": topics})
-        except ClientError as exception:
-            self._handle_error(exception, "list_topics")
-            raise
-        except Exception as exception:
-            self.logger.error(f"Unexpected error in list_topics: {str(exception)}")
-            raise
+        with self._api_call("list_topics"):
+            paginator = self._get_client(region).get_paginator("list_topics")
+            topics: ListTopicsResponseTypeDef = paginator.paginate().build_full_result()
+            return topics
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_topic_attributes(
         self, region: str, topic_arn: str
     ) -> GetTopicAttributesResponseTypeDef:
         """Get SNS topic attributes in specified region."""
-        try:
+        with self._api_call("get_topic_attributes"):
             client = self._get_client(region)
-            return cast(
-                GetTopicAttributesResponseTypeDef,
-                client.get_topic_attributes(TopicArn=topic_arn),
-            )
-        except ClientError as exception:
-            self._handle_error(exception, "get_topic_attributes")
-            raise
-        except Exception as exception:
-            self.logger.error(
-                f"Unexpected error in get_topic_attributes: {str(exception)}"
+            response: GetTopicAttributesResponseTypeDef = client.get_topic_attributes(
+                TopicArn=topic_arn
             )
-            raise
+            return response
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def list_subscriptions_by_topic(
         self, topic_arn: str, region: str
     ) -> ListSubscriptionsByTopicResponseTypeDef:
         """List SNS subscriptions for a topic."""
-        try:
+        with self._api_call("list_subscriptions_by_topic"):
             client = self._get_client(region)
             paginator = client.get_paginator("list_subscriptions_by_topic")
+            subscriptions: ListSubscriptionsByTopicResponseTypeDef = paginator.paginate(
+                TopicArn=topic_arn
+            ).build_full_result()
+            return subscriptions
 
-            subscriptions = []
+    def iter_subscriptions_by_topic(
+        self, topic_arn: str, region: str
+    ) -> Iterator[SubscriptionTypeDef]:
+        """Yield SNS subscriptions for a topic, fetching pages lazily."""
+        with self._api_call("list_subscriptions_by_topic"):
+            client = self._get_client(region)
+            paginator = client.get_paginator("list_subscriptions_by_topic")
             for page in paginator.paginate(TopicArn=topic_arn):
-                subscriptions.extend(page.get("Subscriptions", []))
-
-            return cast(
-                ListSubscriptionsByTopicResponseTypeDef,
-                {"Subscriptions": subscriptions},
-            )
-        except ClientError as exception:
-            self._handle_error(exception, "list_subscriptions_by_topic")
-            raise
+                yield from page.get("Subscriptions", [])
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
     def get_subscription_attributes(
         self, subscription_arn: str, region: str
     ) -> Dict[str, Any]:
         """Get SNS subscription attributes."""
-        try:
+        with self._api_call("get_subscription_attributes"):
             client = self._get_client(region)
             response = client.get_subscription_attributes(
                 SubscriptionArn=subscription_arn
             )
             return response.get("Attributes", {})  # type: ignore[no-any-return]
-        except ClientError as exception:
-            self._handle_error(exception, "get_subscription_attributes")
-            raise
+
+    def iter_subscription_attributes(
+        self, subscription_arns: Iterable[str], region: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch attributes for many SNS subscriptions concurrently.
+
+        ListSubscriptionsByTopic pages must be read in order because each
+        NextToken comes from the previous page, so concurrency is applied to
+        the per-subscription GetSubscriptionAttributes calls instead.
+        Attributes are yielded as they arrive; requests that have not started
+        yet are cancelled if the caller stops iterating early.
+        """
+        futures = [
+            SHARED_EXECUTOR.submit(self.get_subscription_attributes, arn, region)
+            for arn in subscription_arns
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
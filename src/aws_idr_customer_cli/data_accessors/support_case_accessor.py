@@ -4,7 +4,10 @@ from botocore.exceptions import ClientError
 from injector import inject
 from retry import retry
 
-from aws_idr_customer_cli.data_accessors.base_accessor import BaseAccessor
+from aws_idr_customer_cli.data_accessors.base_accessor import (
+    BaseAccessor,
+    retry_on_transient_error,
+)
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
 
@@ -18,7 +21,7 @@ class SupportCaseAccessor(BaseAccessor):
         super().__init__(logger, "AWS Support API")
         self.client = support_client
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
+    @retry_on_transient_error(tries=MAX_RETRIES)
     def create_support_case(
         self,
         subject: str,
@@ -31,7 +34,7 @@ class SupportCaseAccessor(BaseAccessor):
         serviceCode: str,
     ) -> str:
         """Create AWS Support Case"""
-        try:
+        with self._api_call("create_support_case"):
             params: Dict[str, Any] = {
                 "subject": subject,
                 "serviceCode": serviceCode,
@@ -53,14 +56,7 @@ class SupportCaseAccessor(BaseAccessor):
                 )
             return str(case_id)
 
-        except ClientError as exception:
-            self._handle_error(exception, "create_support_case")
-            raise
-        except Exception as e:
-            self.logger.error(f"Failed to create support case: {str(e)}")
-            raise
-
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
+    @retry_on_transient_error(tries=MAX_RETRIES)
     def add_attachments_to_set(
         self, attachments: List[Dict[str, Any]], attachment_set_id: Optional[str] = None
     ) -> str:
@@ -68,7 +64,7 @@ class SupportCaseAccessor(BaseAccessor):
         Add attachments to a set for AWS Support case.
         AWS API limit: Maximum 3 attachments per attachment set (total, not per call).
         """
-        try:
+        with self._api_call("add_attachments_to_set"):
             params: Dict[str, Any] = {"attachments": attachments}
             if attachment_set_id is not None:
                 params["attachmentSetId"] = attachment_set_id
@@ -79,14 +75,8 @@ class SupportCaseAccessor(BaseAccessor):
                     "AWS Support API response missing required field: attachmentSetId"
                 )
             return str(attachment_set_id_val)
-        except ClientError as exception:
-            self._handle_error(exception, "add_attachments_to_set")
-            raise
-        except Exception as e:
-            self.logger.error(f"Failed to add attachments to set: {str(e)}")
-            raise
 
-    @retry(exceptions=ClientError, tries=MAX_RETRIES, delay=1, backoff=2, logger=None)
+    @retry_on_transient_error(tries=MAX_RETRIES)
     def describe_cases(
         self,
         case_id_list: Optional[List[str]] = None,
@@ -98,7 +88,7 @@ class SupportCaseAccessor(BaseAccessor):
         include_communications: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
         """Describe AWS Support Cases with optional parameters"""
-        try:
+        with self._api_call("describe_cases"):
             result = []
             paginator = self.client.get_paginator("describe_cases")
             params: Dict[str, Any] = {}
@@ -116,17 +106,35 @@ class SupportCaseAccessor(BaseAccessor):
                 params["language"] = language
             if include_communications is not None:
                 params["includeCommunications"] = include_communications
-            for page in paginator.paginate(**params):
+            # DescribeCases returns at most 100 cases per page
+            for page in paginator.paginate(
+                PaginationConfig={"PageSize": 100}, **params
+            ):
                 result.extend(page.get("cases", []))
             return result
-        except ClientError as exception:
-            self._handle_error(exception, "describe_cases")
-            raise
-        except Exception as e:
-            self.logger.error(f"Failed to describe cases: {str(e)}")
-            raise
 
-    @retry(exceptions=ClientError, tries=3, delay=65, backoff=1, logger=None)
+    @retry_on_transient_error(tries=MAX_RETRIES)
+    def find_open_case_by_subject(self, subject: str) -> Optional[Dict[str, Any]]:
+        """Return the first unresolved case with the given subject, if any.
+
+        Pages are requested without communications and the scan stops at the
+        first match, so later pages are never fetched.
+        """
+        with self._api_call("find_open_case_by_subject"):
+            paginator = self.client.get_paginator("describe_cases")
+            for page in paginator.paginate(
+                PaginationConfig={"PageSize": 100},
+                includeResolvedCases=False,
+                includeCommunications=False,
+            ):
+                for case in page.get("cases", []):
+                    if case.get("subject") == subject:
+                        return dict(case)
+            return None
+
+    @retry(
+        exceptions=ClientError, tries=3, delay=65, backoff=1, jitter=(0, 5), logger=None
+    )
     def add_communication_to_case(
         self,
         case_id: str,
@@ -143,7 +151,7 @@ class SupportCaseAccessor(BaseAccessor):
 
         The 65s delay handles both retries and rate limiting between successive calls.
         """
-        try:
+        with self._api_call("add_communication_to_case"):
             params: Dict[str, Any] = {"caseId": case_id, "communicationBody": body}
             if attachment_set_id is not None:
                 params["attachmentSetId"] = attachment_set_id
@@ -156,9 +164,3 @@ class SupportCaseAccessor(BaseAccessor):
                     f"AWS Support API failed to add communication to case {case_id}. "
                     f"API returned result=False, indicating the operation was unsuccessful."
                 )
-        except ClientError as exception:
-            self._handle_error(exception, "add_communication_to_case")
-            raise
-        except Exception as e:
-            self.logger.error(f"Failed to add communication to case: {str(e)}")
-            raise
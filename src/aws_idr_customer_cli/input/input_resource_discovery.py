@@ -92,7 +92,8 @@ class InputResourceDiscovery:
                     return [], tag_filters
 
             # Extract ARN strings
-            alarm_arns = [r["ResourceArn"].arn for r in resources if "ResourceArn" in r]
+            resource_arns = (r.get("ResourceArn") for r in resources)
+            alarm_arns = [ra.arn for ra in resource_arns if ra is not None]
 
             return alarm_arns, tag_filters
 
@@ -1,7 +1,12 @@
+import sys
+import threading
+
 import click
 from injector import Injector
 
+from aws_idr_customer_cli.clients.sts import BotoStsManager
 from aws_idr_customer_cli.core.registry import CommandRegistry
+from aws_idr_customer_cli.modules.accessors import warm_aws_clients
 from aws_idr_customer_cli.modules.injector_config import AppModule
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
@@ -11,6 +16,25 @@ class CLI:
         # Set up dependency injection
         self.injector = Injector([AppModule()])
         self.logger = self.injector.get(CliLogger)
+        # Build common AWS clients in the background while commands load. A
+        # daemon thread is used because executor workers are joined at
+        # interpreter exit, which would hold up quick commands such as --help
+        # until warm-up finished.
+        threading.Thread(
+            target=self._warm_clients, name="idr-client-warmup", daemon=True
+        ).start()
+
+    def _warm_clients(self) -> None:
+        """Create the AWS clients most commands need ahead of first use."""
+        warm_aws_clients(self.logger)
+        try:
+            # Every command injects the STS manager; building the singleton
+            # here creates its client while commands are being discovered.
+            # injector's singleton scope is locked, so a command resolving it
+            # concurrently waits for this instance instead of building another
+            self.injector.get(BotoStsManager)
+        except Exception as e:
+            self.logger.debug("STS manager warm-up failed: %s", e)
 
     def run(self) -> None:
         try:
@@ -23,6 +47,14 @@ class CLI:
             cli(obj={"injector": self.injector})  # [1]
 
         except Exception as e:
+            # Accessors let unexpected errors propagate unlogged; record which
+            # command failed and keep the traceback available with --debug
+            command_name = next(
+                (arg for arg in sys.argv[1:] if not arg.startswith("-")), None
+            )
+            self.logger.debug(
+                "Unhandled error in command %s: %s", command_name, e, exc_info=True
+            )
             # Display error to user
             click.secho(f"Error: {str(e)}", fg="red", err=True)
 
@@ -1,7 +1,8 @@
-from functools import lru_cache
-from typing import Any
+import os
+import threading
+from typing import Any, Dict, Tuple
 
-import boto3
+from botocore.config import Config
 from injector import Module, provider, singleton
 from mypy_boto3_support import SupportClient
 
@@ -35,6 +36,11 @@ from aws_idr_customer_cli.data_accessors.sns_accessor import SnsAccessor
 from aws_idr_customer_cli.data_accessors.support_case_accessor import (
     SupportCaseAccessor,
 )
+from aws_idr_customer_cli.utils.aws_session import (
+    create_session_client,
+    get_aws_session,
+)
+from aws_idr_customer_cli.utils.constants import DEFAULT_REGION, MAX_PARALLEL_WORKERS
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
 SERVICE_REGION_FALLBACK_MAPPING = {
@@ -45,13 +51,97 @@ SERVICE_REGION_FALLBACK_MAPPING = {
     "logs": "us-east-1",
 }
 
+# HTTP connections kept per client. botocore defaults to 10, which would cap
+# in-flight requests per region below what the parallel fan-outs issue.
+# Operators can tune it with AWS_IDR_MAX_POOL.
+MAX_POOL_CONNECTIONS_ENV = "AWS_IDR_MAX_POOL"
+DEFAULT_MAX_POOL_CONNECTIONS = max(MAX_PARALLEL_WORKERS * 2, 50)
+
+
+def _read_max_pool_connections() -> int:
+    """Read the pool size from the environment, falling back to the default.
+
+    This runs at import time, so an invalid value is reported and ignored
+    rather than raised, which would break every command including --help.
+    """
+    value = os.environ.get(MAX_POOL_CONNECTIONS_ENV)
+    if value is None:
+        return DEFAULT_MAX_POOL_CONNECTIONS
+    try:
+        pool_size = int(value)
+    except ValueError:
+        pool_size = 0
+    if pool_size < 1:
+        CliLogger("accessors").warning(
+            "Ignoring invalid %s value %r; using %s",
+            MAX_POOL_CONNECTIONS_ENV,
+            value,
+            DEFAULT_MAX_POOL_CONNECTIONS,
+        )
+        return DEFAULT_MAX_POOL_CONNECTIONS
+    return pool_size
+
+
+MAX_POOL_CONNECTIONS = _read_max_pool_connections()
+
+# Retries are handled by botocore's adaptive mode, which retries only
+# transient/throttling and connection errors and applies jittered backoff with
+# client-side rate limiting. Short connect timeout avoids long hangs on
+# unreachable regions.
+AWS_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    connect_timeout=3,
+    read_timeout=30,
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+)
+
+# Services used by nearly every command, created ahead of time by
+# warm_aws_clients
+WARM_CLIENT_SERVICES = ("cloudwatch",)
+
+
+# Clients keyed by (service, resolved region). Creation is guarded so that
+# threads missing on the same key at once build the client only once.
+_CLIENT_CACHE: Dict[Tuple[str, str], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
 
-@lru_cache
 def create_aws_client(service: str, region: str) -> Any:
     """Universal cached AWS client factory."""
     if region == "global" and service in SERVICE_REGION_FALLBACK_MAPPING:
         region = SERVICE_REGION_FALLBACK_MAPPING[service]
-    return boto3.client(service, region_name=region)  # type: ignore
+    key = (service, region)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = create_session_client(
+                    service, region_name=region, config=AWS_CLIENT_CONFIG
+                )
+                _CLIENT_CACHE[key] = client
+    return client
+
+
+def warm_aws_clients(logger: CliLogger) -> None:
+    """Create the clients most commands need before the first API call.
+
+    Client construction (endpoint resolution, service model loading) costs a
+    few hundred milliseconds per client. Running this in the background at
+    start-up overlaps that cost with command discovery and argument parsing;
+    later calls to create_aws_client are then cache hits. Warm-up is best
+    effort: errors are only logged at debug level and surface on first real
+    use instead.
+
+    Args:
+        logger: CLI logger for warm-up failures
+    """
+    try:
+        region = get_aws_session().region_name or DEFAULT_REGION
+        for service in WARM_CLIENT_SERVICES:
+            create_aws_client(service, region)
+    except Exception as e:
+        logger.debug("AWS client warm-up failed: %s", e)
 
 
 class AccessorsModule(Module):
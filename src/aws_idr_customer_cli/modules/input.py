@@ -32,12 +32,6 @@ class InputModule(Module):
         """Provide an instance of ClickInputService with required dependencies."""
         return ClickInputService(logger)
 
-    @provider
-    @singleton
-    def provide_interactive_ui(self) -> InteractiveUI:
-        """Provide InteractiveUI instance."""
-        return InteractiveUI()
-
     @provider
     @singleton
     def provide_input_resource_discovery(
@@ -168,10 +168,12 @@ class ServiceClientsModule(injector.Module):
         self,
         logger: CliLogger,
         cloudfront_accessor: CloudFrontAccessor,
+        sts_manager: BotoStsManager,
     ) -> LambdaEdgeDetectionService:
         return LambdaEdgeDetectionService(
             logger=logger,
             cloudfront_accessor=cloudfront_accessor,
+            sts_manager=sts_manager,
         )
 
     @injector.singleton
@@ -149,6 +149,11 @@ class AlarmRecommendationService:
             self.logger.warning("No resources provided for alarm generation")
             return []
 
+        # Only Lambda resources need the Lambda@Edge cache; start loading it
+        # in the background while the resources before them are processed
+        if any(resource.arn.startswith("arn:aws:lambda:") for resource in resources):
+            self.lambda_edge_detection_service.prefetch()
+
         alarm_configurations = []
 
         for resource in resources:
@@ -1,10 +1,11 @@
+from __future__ import annotations
+
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 from injector import inject
-from mypy_boto3_cloudwatch.type_defs import MetricAlarmTypeDef
 
 from aws_idr_customer_cli.clients.sts import BotoStsManager
 from aws_idr_customer_cli.core.interactive.ui import InteractiveUI
@@ -29,6 +30,9 @@ from aws_idr_customer_cli.utils.arn_utils import (
 from aws_idr_customer_cli.utils.constants import Region
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
+if TYPE_CHECKING:
+    from mypy_boto3_cloudwatch.type_defs import MetricAlarmTypeDef
+
 S3_IDENTIFIER = ":s3:::"
 
 
@@ -105,8 +109,10 @@ class AlarmService:
 
         all_alarms = {}
 
-        for region in regions:
-            alarms = self.accessor.list_alarms_by_prefix(self.IDR_ALARM_PREFIX, region)
+        alarms_by_region = self.accessor.list_alarms_by_prefix_in_regions(
+            self.IDR_ALARM_PREFIX, regions
+        )
+        for alarms in alarms_by_region.values():
             # Update dictionary with alarms from this region
             all_alarms.update({alarm["AlarmName"]: alarm for alarm in alarms})
 
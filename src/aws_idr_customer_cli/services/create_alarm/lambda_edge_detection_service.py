@@ -2,20 +2,55 @@
 
 This service determines whether a Lambda function is deployed as Lambda@Edge
 by checking its associations with CloudFront distributions. Uses an in-memory
-cache populated via parallel API calls for performance.
+cache populated via parallel API calls for performance, persisted to disk so
+short-lived CLI invocations can reuse it.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-from typing import Any, Dict, List, Set
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from threading import BoundedSemaphore, Event, Lock, Thread
+from typing import Any, DefaultDict, Dict, FrozenSet, Iterator, List, Optional, Set
 
 from botocore.exceptions import ClientError
 from injector import inject
 
+from aws_idr_customer_cli.clients.sts import BotoStsManager
 from aws_idr_customer_cli.data_accessors.cloudfront_accessor import CloudFrontAccessor
+from aws_idr_customer_cli.utils.aws_session import get_aws_session
 from aws_idr_customer_cli.utils.constants import MAX_PARALLEL_WORKERS
+from aws_idr_customer_cli.utils.executor import SHARED_EXECUTOR
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
+# Unversioned Lambda ARNs have 7 colon-separated fields; a version adds an 8th
+UNVERSIONED_LAMBDA_ARN_SEPARATORS = 6
+
+EDGE_CACHE_DIR = Path.home() / ".aws-idr" / "cache"
+EDGE_CACHE_TTL_SECONDS = 3600
+# Set to any non-empty value to ignore the on-disk cache and reload it
+REFRESH_EDGE_CACHE_ENV = "AWS_IDR_REFRESH_EDGE_CACHE"
+
+
+@lru_cache(maxsize=8192)
+def normalize_lambda_arn(function_arn: str) -> str:
+    """Strip a numeric version suffix from a Lambda ARN.
+
+    Memoized because the same ARNs recur across distributions and alarm
+    templates. Results are interned so cache keys and lookups share one
+    string object per function.
+    """
+    head, sep, tail = function_arn.rpartition(":")
+    if sep and tail.isdigit() and head.count(":") >= UNVERSIONED_LAMBDA_ARN_SEPARATORS:
+        return sys.intern(head)
+    return sys.intern(function_arn)
+
 
 class LambdaEdgeDetectionService:
     """Service for detecting Lambda@Edge function associations.
@@ -35,29 +70,60 @@ class LambdaEdgeDetectionService:
         self,
         logger: CliLogger,
         cloudfront_accessor: CloudFrontAccessor,
+        sts_manager: BotoStsManager,
     ) -> None:
         """Initialize LambdaEdgeDetectionService.
 
         Args:
             logger: CLI logger instance
             cloudfront_accessor: CloudFront data accessor for API calls
+            sts_manager: STS manager used to scope the on-disk cache per account
         """
         self.logger = logger
         self.cloudfront_accessor = cloudfront_accessor
-
-        self._cache_loaded: bool = False
-        self._lambda_edge_map: Dict[str, Set[str]] = {}
-        self._map_lock: Lock = Lock()
+        self.sts_manager = sts_manager
+
+        # Set once the cache is loaded; the lock keeps concurrent first
+        # callers from each starting their own load
+        self._cache_ready = Event()
+        self._loading_lock = Lock()
+        # Access denied will not change within a run, so stop retrying loads
+        self._cache_permanently_unavailable: bool = False
+        self._prefetch_started: bool = False
+        self._load_attempted: bool = False
+        # A failed background load is reported by the next lookup rather than
+        # from the prefetch thread at an arbitrary point in the command
+        self._deferred_load_error: Optional[Exception] = None
+        # Associations accumulate in a mutable map while loading and are
+        # frozen once the load finishes, so lookups can share the sets
+        self._pending_edge_map: DefaultDict[str, Set[str]] = defaultdict(set)
+        self._lambda_edge_map: Dict[str, FrozenSet[str]] = {}
+
+    def prefetch(self) -> None:
+        """Start loading the cache in the background, at most once.
+
+        Called when a flow that will look up Lambda functions begins, so the
+        cache is usually ready by the first lookup; lookups made sooner wait
+        on _loading_lock for it. The daemon thread keeps the CLI from waiting
+        on the load at exit.
+        """
+        if self._prefetch_started or self._cache_ready.is_set():
+            return
+        self._prefetch_started = True
+        Thread(
+            target=self._prefetch_cache, name="idr-edge-cache-warmup", daemon=True
+        ).start()
 
     def is_lambda_edge_function(self, function_arn: str) -> bool:
         """Determine if Lambda function is deployed as Lambda@Edge.
 
-        Uses in-memory cache for performance. On first call, loads all
-        CloudFront distributions into cache. Subsequent calls perform
-        instant in-memory lookups.
+        Uses in-memory cache for performance. All CloudFront distributions
+        are loaded into cache by prefetch() or, failing that, on this call.
+        Subsequent calls perform instant in-memory lookups.
 
         Performance:
-            - First call: ~1-2 seconds (one-time cache load)
+            - First call: waits for the cache load (~1-2 seconds, or a file
+              read when a fresh on-disk cache exists) if it has not finished
             - Subsequent calls: <1ms (in-memory lookup)
 
         Args:
@@ -71,35 +137,32 @@ class LambdaEdgeDetectionService:
                 self.logger.warning(f"Invalid Lambda ARN format: {function_arn}")
                 return False
 
-            if not self._cache_loaded:
-                self._load_cache()
-
-            if self._cache_loaded:
-                self.logger.debug(
-                    "CloudFront distribution cache is populated. Retrieving..."
+            self._load_cache()
+            if not self._cache_ready.is_set():
+                self.logger.warning(
+                    f"CloudFront cache unavailable. Cannot determine Lambda@Edge "
+                    f"status for {function_arn}. Check CloudFront permissions."
                 )
-                normalized_arn = self._normalize_lambda_arn(function_arn)
-                is_edge = normalized_arn in self._lambda_edge_map
-
-                if is_edge:
-                    dist_ids = self._lambda_edge_map[normalized_arn]
-                    self.logger.info(
-                        f"Lambda function {function_arn} is associated with "
-                        f"{len(dist_ids)} CloudFront distribution(s): "
-                        f"{', '.join(sorted(dist_ids))}"
-                    )
-                else:
-                    self.logger.debug(
-                        f"Lambda function {function_arn} is not associated "
-                        f"with any CloudFront distribution (cached lookup)"
-                    )
-
-                return is_edge
+                return False
 
-            self.logger.warning(
-                f"CloudFront cache unavailable. Cannot determine Lambda@Edge "
-                f"status for {function_arn}. Check CloudFront permissions."
+            dist_ids = self._lambda_edge_map.get(
+                self._normalize_lambda_arn(function_arn)
             )
+            if dist_ids:
+                self.logger.info(
+                    f"Lambda function {function_arn} is associated with "
+                    f"{len(dist_ids)} CloudFront distribution(s): "
+                    f"{', '.join(sorted(dist_ids))}"
+                )
+                return True
+
+            # Most functions are not Lambda@Edge; skip formatting the message
+            # for them unless debug logging is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    f"Lambda function {function_arn} is not associated "
+                    f"with any CloudFront distribution (cached lookup)"
+                )
             return False
 
         except Exception as e:
@@ -108,30 +171,82 @@ class LambdaEdgeDetectionService:
             )
             return False
 
-    def get_associated_distributions(self, function_arn: str) -> Set[str]:
+    def get_associated_distributions(self, function_arn: str) -> FrozenSet[str]:
         """Get CloudFront distribution IDs associated with a Lambda function.
 
         Args:
             function_arn: Lambda function ARN (versioned or unversioned)
 
         Returns:
-            Set of distribution IDs, or empty set if not Lambda@Edge
+            Immutable set of distribution IDs, or empty set if not Lambda@Edge
         """
-        if not self._cache_loaded:
-            self._load_cache()
-
-        if not self._cache_loaded:
-            return set()
+        self._load_cache()
+        if not self._cache_ready.is_set():
+            return frozenset()
 
         normalized_arn = self._normalize_lambda_arn(function_arn)
-        return self._lambda_edge_map.get(normalized_arn, set()).copy()
+        return self._lambda_edge_map.get(normalized_arn, frozenset())
 
     def _load_cache(self) -> None:
+        """Load the cache once, even when called from several threads.
+
+        Callers arriving while another thread is loading wait for that load
+        rather than issuing their own API calls. A failed background load is
+        reported and then retried here; after an access denied error no
+        further loads are attempted.
+        """
+        if self._cache_ready.is_set() or self._cache_permanently_unavailable:
+            return
+
+        with self._loading_lock:
+            if self._deferred_load_error is not None:
+                error, self._deferred_load_error = self._deferred_load_error, None
+                self._report_cache_load_error(error)
+            if not (self._cache_ready.is_set() or self._cache_permanently_unavailable):
+                self._load_attempted = True
+                try:
+                    self._populate_cache()
+                except Exception as error:
+                    self._report_cache_load_error(error)
+
+    def _prefetch_cache(self) -> None:
+        """Background body of prefetch(); keeps any load error for a lookup."""
+        with self._loading_lock:
+            if self._load_attempted:
+                return
+            self._load_attempted = True
+            try:
+                self._populate_cache()
+            except Exception as error:
+                self._deferred_load_error = error
+
+    def _report_cache_load_error(self, error: Exception) -> None:
+        """Log a failed cache load with the handling for its error type.
+
+        Args:
+            error: Exception raised by _populate_cache
+        """
+        # CloudFrontAccessor maps access denied errors to PermissionError
+        if isinstance(error, PermissionError):
+            self._disable_cache_after_access_denied(error)
+        elif isinstance(error, ClientError):
+            self._handle_cache_load_error(error)
+        else:
+            self.logger.error(
+                f"Unexpected error loading CloudFront cache: {str(error)}"
+            )
+
+    def _populate_cache(self) -> None:
         """Load all CloudFront distribution Lambda@Edge associations into cache.
 
-        Uses parallel processing (ThreadPoolExecutor) to fetch distribution
-        configurations concurrently, significantly improving performance for
-        accounts with many distributions.
+        ListDistributions summaries already include each distribution's cache
+        behaviors and their Lambda@Edge associations, so the cache is built
+        from the (paginated) listing alone. Only summaries missing the cache
+        behavior fields fall back to fetching the full configuration, in
+        parallel on the shared executor.
+
+        A fully loaded cache is written to disk per account and profile, and
+        reused for EDGE_CACHE_TTL_SECONDS unless REFRESH_EDGE_CACHE_ENV is set.
 
         Cache Structure:
             {
@@ -141,40 +256,150 @@ class LambdaEdgeDetectionService:
 
         Error Handling:
             - Individual distribution errors: Logged, processing continues
-            - Overall API errors: Cache load aborted, _cache_loaded stays False
+            - Overall API errors: Raised to the caller, _cache_ready stays unset
             - Partial success: Cache populated with successful distributions
         """
-        if self._cache_loaded:
+        cache_path = self._get_disk_cache_path()
+        if cache_path and self._load_disk_cache(cache_path):
+            self._cache_ready.set()
             return
 
+        self.logger.info("Loading CloudFront distribution cache...")
+
+        distributions = self.cloudfront_accessor.list_distributions()
+
+        association_count = 0
+        summary_count = 0
+        fallback_ids: List[str] = []
+        for summary in distributions:
+            dist_id = summary.get("Id")
+            if not dist_id:
+                continue
+            if "DefaultCacheBehavior" not in summary:
+                fallback_ids.append(dist_id)
+                continue
+            association_count += self._process_distribution_config(dist_id, summary)
+            summary_count += 1
+
+        self.logger.info(
+            f"Found {summary_count + len(fallback_ids)} distributions, "
+            f"{len(fallback_ids)} need full configuration lookups"
+        )
+
+        # The usual case: every summary was complete, so no thread pool or
+        # per-distribution request is needed at all
+        if fallback_ids:
+            stats = self._process_distributions_in_parallel(fallback_ids)
+        else:
+            stats = {
+                "successful_count": 0,
+                "failed_count": 0,
+                "association_count": 0,
+            }
+        stats["successful_count"] += summary_count
+        stats["association_count"] += association_count
+
+        self._lambda_edge_map = {
+            arn: frozenset(dist_ids) for arn, dist_ids in self._pending_edge_map.items()
+        }
+        self._pending_edge_map = defaultdict(set)
+        self._cache_ready.set()
+        self._log_cache_load_summary(summary_count + len(fallback_ids), stats)
+
+        # A partial load would hide associations until the TTL expires
+        if cache_path and stats["failed_count"] == 0:
+            self._save_disk_cache(cache_path)
+
+    def _get_disk_cache_path(self) -> Optional[Path]:
+        """Build the on-disk cache path for the current account and profile.
+
+        Returns:
+            Cache file path, or None if the account cannot be determined
+        """
         try:
-            self.logger.info("Loading CloudFront distribution cache...")
+            account_id = self.sts_manager.retrieve_account_id_from_sts()
+        except Exception as e:
+            self.logger.debug(f"Skipping on-disk CloudFront cache: {str(e)}")
+            return None
 
-            distributions = self.cloudfront_accessor.list_distributions()
-            distribution_ids = [d.get("Id") for d in distributions if d.get("Id")]
+        profile = get_aws_session().profile_name or "default"
+        safe_profile = re.sub(r"[^A-Za-z0-9_.-]", "_", profile)
+        return EDGE_CACHE_DIR / f"lambda_edge_map_{account_id}_{safe_profile}.json"
 
-            self.logger.info(
-                f"Found {len(distribution_ids)} distributions, "
-                f"loading configurations in parallel..."
-            )
+    def _load_disk_cache(self, cache_path: Path) -> bool:
+        """Populate the cache from disk if a fresh copy exists.
 
-            stats = self._process_distributions_in_parallel(distribution_ids)
+        Args:
+            cache_path: On-disk cache file path
 
-            self._cache_loaded = True
-            self._log_cache_load_summary(len(distribution_ids), stats)
+        Returns:
+            True if the in-memory cache was populated from disk
+        """
+        if os.environ.get(REFRESH_EDGE_CACHE_ENV):
+            return False
 
-        except ClientError as error:
-            self._handle_cache_load_error(error)
-        except Exception as error:
-            self.logger.error(
-                f"Unexpected error loading CloudFront cache: {str(error)}. "
-                f"Falling back to non-cached lookups."
-            )
+        try:
+            if time.time() - cache_path.stat().st_mtime > EDGE_CACHE_TTL_SECONDS:
+                return False
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        # A file of the wrong shape is treated like a missing one so the
+        # cache is rebuilt from the API instead of failing until the TTL ends
+        if not isinstance(data, dict) or not all(
+            isinstance(arn, str)
+            and isinstance(dist_ids, list)
+            and all(isinstance(dist_id, str) for dist_id in dist_ids)
+            for arn, dist_ids in data.items()
+        ):
+            self.logger.debug(f"Ignoring malformed CloudFront cache at {cache_path}")
+            return False
+
+        self._lambda_edge_map = {
+            arn: frozenset(dist_ids) for arn, dist_ids in data.items()
+        }
+
+        self.logger.info(
+            f"CloudFront cache loaded from {cache_path}: "
+            f"{len(self._lambda_edge_map)} Lambda@Edge functions"
+        )
+        return True
+
+    def _save_disk_cache(self, cache_path: Path) -> None:
+        """Atomically write the in-memory cache to disk.
+
+        Args:
+            cache_path: On-disk cache file path
+        """
+        data = {arn: sorted(ids) for arn, ids in self._lambda_edge_map.items()}
+        temp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # NamedTemporaryFile creates the file readable by the owner only
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                dir=cache_path.parent,
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+            ) as temp_file:
+                temp_path = temp_file.name
+                json.dump(data, temp_file)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            self.logger.debug(f"Could not write CloudFront cache to disk: {str(e)}")
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
 
     def _process_distributions_in_parallel(
         self, distribution_ids: List[str]
     ) -> Dict[str, int]:
-        """Process multiple distributions concurrently using ThreadPoolExecutor.
+        """Process multiple distributions concurrently on the shared executor.
+
+        Reusing the process-wide pool avoids starting threads for each load
+        and keeps the CloudFront client's pooled connections warm. Workers
+        only make API calls and never wait on other shared-executor tasks.
 
         Args:
             distribution_ids: List of CloudFront distribution IDs to process
@@ -185,32 +410,29 @@ class LambdaEdgeDetectionService:
             - failed_count: Number of distributions that failed to process
             - association_count: Total number of Lambda associations found
         """
-        association_count = 0
-        successful_count = 0
-        failed_count = 0
+        # Bound queued work so submission waits for workers instead of
+        # queueing every distribution up front: executor.map drains the
+        # admitting generator eagerly, and each worker frees its slot
+        in_flight = BoundedSemaphore(MAX_PARALLEL_WORKERS * 2)
 
-        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_WORKERS) as executor:
-            future_to_dist_id = {
-                executor.submit(self._fetch_and_process_distribution, dist_id): dist_id
-                for dist_id in distribution_ids
-            }
+        def admit() -> Iterator[str]:
+            for dist_id in distribution_ids:
+                in_flight.acquire()
+                yield dist_id
 
-            for future in as_completed(future_to_dist_id):
-                dist_id = future_to_dist_id[future]
-                try:
-                    result = future.result()
-                    association_count += result["associations"]
-                    successful_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    self.logger.warning(
-                        f"Failed to process distribution {dist_id}: {str(e)}"
-                    )
+        def process(dist_id: str) -> Dict[str, int]:
+            try:
+                return self._fetch_and_process_distribution(dist_id)
+            finally:
+                in_flight.release()
+
+        results = list(SHARED_EXECUTOR.map(process, admit()))
 
+        successful_count = sum(result["ok"] for result in results)
         return {
             "successful_count": successful_count,
-            "failed_count": failed_count,
-            "association_count": association_count,
+            "failed_count": len(results) - successful_count,
+            "association_count": sum(result["associations"] for result in results),
         }
 
     def _fetch_and_process_distribution(self, dist_id: str) -> Dict[str, int]:
@@ -224,26 +446,40 @@ class LambdaEdgeDetectionService:
 
         Returns:
             Dictionary with processing statistics:
+            - 'ok': 1 if the distribution was processed, 0 if it failed
             - 'associations': Number of Lambda associations found
         """
         try:
             distribution = self.cloudfront_accessor.get_distribution(dist_id)
             if not distribution:
-                return {"associations": 0}
+                return {"ok": 1, "associations": 0}
 
             config = distribution.get("DistributionConfig", {})
-            lambda_arns = self._extract_lambda_associations(config)
-
-            association_count = 0
-            for arn in lambda_arns:
-                if self._process_lambda_association(arn, dist_id):
-                    association_count += 1
-
-            return {"associations": association_count}
+            return {
+                "ok": 1,
+                "associations": self._process_distribution_config(dist_id, config),
+            }
 
         except Exception as error:
             self._handle_distribution_error(dist_id, error)
-            return {"associations": 0}
+            return {"ok": 0, "associations": 0}
+
+    def _process_distribution_config(self, dist_id: str, config: Dict[str, Any]) -> int:
+        """Add the Lambda@Edge associations of one distribution to the cache.
+
+        Args:
+            dist_id: CloudFront distribution ID
+            config: Distribution summary or DistributionConfig; both carry
+                DefaultCacheBehavior and CacheBehaviors
+
+        Returns:
+            Number of Lambda associations added
+        """
+        association_count = 0
+        for arn in self._extract_lambda_associations(config):
+            if self._process_lambda_association(arn, dist_id):
+                association_count += 1
+        return association_count
 
     def _extract_lambda_associations(self, config: Dict[str, Any]) -> List[str]:
         """Extract all Lambda@Edge ARNs from distribution configuration.
@@ -258,33 +494,22 @@ class LambdaEdgeDetectionService:
         Returns:
             List of Lambda function ARNs found in the distribution
         """
-        lambda_arns: List[str] = []
-
-        default_cb = config.get("DefaultCacheBehavior", {})
-        default_associations = default_cb.get("LambdaFunctionAssociations", {}).get(
-            "Items", []
-        )
-        for assoc in default_associations:
-            arn = assoc.get("LambdaFunctionARN", "")
-            if arn:
-                lambda_arns.append(arn)
-
-        cache_behaviors = config.get("CacheBehaviors", {}).get("Items", [])
-        for behavior in cache_behaviors:
-            associations = behavior.get("LambdaFunctionAssociations", {}).get(
-                "Items", []
-            )
-            for assoc in associations:
-                arn = assoc.get("LambdaFunctionARN", "")
-                if arn:
-                    lambda_arns.append(arn)
-
-        return lambda_arns
+        behaviors = [config.get("DefaultCacheBehavior", {})]
+        behaviors.extend(config.get("CacheBehaviors", {}).get("Items", []))
+        return [
+            assoc["LambdaFunctionARN"]
+            for behavior in behaviors
+            for assoc in behavior.get("LambdaFunctionAssociations", {}).get("Items", [])
+            if assoc.get("LambdaFunctionARN")
+        ]
 
     def _process_lambda_association(self, lambda_arn: str, dist_id: str) -> bool:
         """Process a single Lambda@Edge association and add to cache.
 
-        Thread-safe method that normalizes ARN and updates the shared cache map.
+        Thread-safe method that normalizes ARN and updates the pending map.
+        Missing keys are filled by the builtin set factory and set.add is
+        atomic under the GIL, so parallel workers update the map without
+        taking a lock.
 
         Args:
             lambda_arn: Lambda function ARN (may be versioned)
@@ -298,10 +523,7 @@ class LambdaEdgeDetectionService:
 
         normalized_arn = self._normalize_lambda_arn(lambda_arn)
 
-        with self._map_lock:
-            if normalized_arn not in self._lambda_edge_map:
-                self._lambda_edge_map[normalized_arn] = set()
-            self._lambda_edge_map[normalized_arn].add(dist_id)
+        self._pending_edge_map[normalized_arn].add(dist_id)
 
         return True
 
@@ -324,10 +546,7 @@ class LambdaEdgeDetectionService:
             arn:aws:lambda:us-east-1:123:function:my-func
             -> arn:aws:lambda:us-east-1:123:function:my-func (unchanged)
         """
-        parts = function_arn.split(":")
-        if len(parts) >= 8 and parts[-1].isdigit():
-            return ":".join(parts[:-1])
-        return function_arn
+        return normalize_lambda_arn(function_arn)
 
     def _handle_distribution_error(self, dist_id: str, error: Exception) -> None:
         """Handle errors that occur during distribution processing.
@@ -357,15 +576,21 @@ class LambdaEdgeDetectionService:
         """
         error_code = error.response.get("Error", {}).get("Code", "")
         if error_code in self.ACCESS_DENIED_ERRORS:
-            self.logger.warning(
-                f"Access denied loading CloudFront cache: {str(error)}. "
-                f"Falling back to non-cached lookups."
-            )
+            self._disable_cache_after_access_denied(error)
         else:
-            self.logger.error(
-                f"Error loading CloudFront cache: {str(error)}. "
-                f"Falling back to non-cached lookups."
-            )
+            self.logger.error(f"Error loading CloudFront cache: {str(error)}")
+
+    def _disable_cache_after_access_denied(self, error: Exception) -> None:
+        """Stop further cache loads for this run after an access denied error.
+
+        Args:
+            error: PermissionError or access denied ClientError from the load
+        """
+        self._cache_permanently_unavailable = True
+        self.logger.warning(
+            f"Access denied loading CloudFront cache: {str(error)}. "
+            f"Lambda@Edge detection is skipped for the rest of this run."
+        )
 
     def _log_cache_load_summary(self, total_count: int, stats: Dict[str, int]) -> None:
         """Log summary of cache loading results.
@@ -6,9 +6,11 @@ published to the region where execution occurs, not us-east-1 where the
 function is defined.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
 
-from arnparse import arnparse
 from injector import inject
 
 from aws_idr_customer_cli.data_accessors.cloudwatch_metrics_accessor import (
@@ -18,6 +20,35 @@ from aws_idr_customer_cli.services.file_cache.data import ResourceArn
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 from aws_idr_customer_cli.utils.region_utils import get_valid_regions
 
+# Captures the function name from an unqualified or version-qualified ARN
+_LAMBDA_ARN_PATTERN = re.compile(
+    r"^arn:[^:]+:lambda:[^:]+:\d+:function:([^:]+)(?::[^:]+)?$"
+)
+
+
+@lru_cache(maxsize=1024)
+def _extract_lambda_function_name(function_arn: str) -> Optional[str]:
+    """Extract the function name from a Lambda ARN, or None if malformed."""
+    match = _LAMBDA_ARN_PATTERN.match(function_arn)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=1024)
+def _lambda_edge_dimension_value(function_name: str) -> str:
+    """Build the interned "us-east-1.{functionName}" dimension value.
+
+    Interned so every region's and template's alarm configuration for a
+    function shares one string object instead of building its own copy.
+    """
+    return sys.intern(f"us-east-1.{function_name}")
+
+
+@lru_cache(maxsize=1)
+def _region_suffix_pattern(regions: Tuple[str, ...]) -> Pattern[str]:
+    """Compile a pattern matching a trailing "-{region}" for any of regions."""
+    alternatives = "|".join(re.escape(region) for region in regions)
+    return re.compile(f"-({alternatives})$")
+
 
 class LambdaEdgeProcessor:
     """Processor for Lambda@Edge alarm configurations.
@@ -58,13 +89,12 @@ class LambdaEdgeProcessor:
             List of unique regions extracted from alarm names
         """
         regions: set[str] = set()
-        valid_regions = get_valid_regions()
+        pattern = _region_suffix_pattern(get_valid_regions())
 
         for name in alarm_names:
-            for region in valid_regions:
-                if name.endswith(f"-{region}"):
-                    regions.add(region)
-                    break
+            match = pattern.search(name)
+            if match:
+                regions.add(match.group(1))
 
         extracted = list(regions)
         if extracted:
@@ -100,19 +130,10 @@ class LambdaEdgeProcessor:
         Returns:
             List of alarm configurations (one set per region with metrics)
         """
-        # Extract function name from ARN using arnparse
-        try:
-            parsed_arn = arnparse(resource.arn)
-            if not parsed_arn.resource:
-                self.logger.error(
-                    f"Invalid Lambda ARN format for Lambda@Edge: {resource.arn}"
-                )
-                return []
-            function_name = parsed_arn.resource
-        except Exception as e:
+        function_name = _extract_lambda_function_name(resource.arn)
+        if not function_name:
             self.logger.error(
-                f"Failed to parse Lambda ARN for Lambda@Edge: "
-                f"{resource.arn} - {str(e)}"
+                f"Invalid Lambda ARN format for Lambda@Edge: {resource.arn}"
             )
             return []
 
@@ -147,6 +168,10 @@ class LambdaEdgeProcessor:
             self.logger.warning("No Lambda alarm templates found")
             return []
 
+        # Lambda@Edge metrics always use prefixed FunctionName dimension:
+        # "us-east-1.{functionName}" in ALL regions, including us-east-1
+        lambda_edge_function_name = _lambda_edge_dimension_value(function_name)
+
         all_configurations: List[Dict[str, Any]] = []
 
         for region in regions_with_metrics:
@@ -161,6 +186,7 @@ class LambdaEdgeProcessor:
                     template=template,
                     resource=region_resource,
                     metric_region=region,
+                    lambda_edge_function_name=lambda_edge_function_name,
                     create_alarm_config_fn=create_alarm_config_fn,
                     suppress_warnings=suppress_warnings,
                 )
@@ -179,6 +205,7 @@ class LambdaEdgeProcessor:
         template: Dict[str, Any],
         resource: ResourceArn,
         metric_region: str,
+        lambda_edge_function_name: str,
         create_alarm_config_fn: Callable[
             [Dict[str, Any], ResourceArn, bool], Optional[Dict[str, Any]]
         ],
@@ -193,6 +220,8 @@ class LambdaEdgeProcessor:
             template: Alarm template
             resource: ResourceArn with region set to metric region
             metric_region: Region where metrics exist
+            lambda_edge_function_name: Prefixed FunctionName dimension value
+                ("us-east-1.{functionName}")
             create_alarm_config_fn: Callback to create base alarm configuration
             suppress_warnings: Whether to suppress warnings
 
@@ -205,40 +234,17 @@ class LambdaEdgeProcessor:
         if not config:
             return None
 
-        try:
-            parsed_arn = arnparse(resource.arn)
-            if not parsed_arn.resource:
-                self.logger.error(
-                    f"Failed to extract function name from ARN: {resource.arn}"
-                )
-                return None
-
-            function_name = parsed_arn.resource
-
-            # Lambda@Edge metrics always use prefixed FunctionName dimension:
-            # "us-east-1.{functionName}" in ALL regions, including us-east-1
-            lambda_edge_function_name = self._get_lambda_edge_function_name(
-                function_name, metric_region
-            )
-
-            template_config = config.get("template_config", {})
+        template_config = config.get("template_config", {})
 
-            # Update Dimensions if present (for basic alarms)
-            self._update_dimensions(
-                template_config.get("Dimensions"), lambda_edge_function_name
-            )
-
-            # Update Metrics dimensions if present (for metric math alarms)
-            self._update_metrics_dimensions(
-                template_config.get("Metrics"), lambda_edge_function_name
-            )
+        # Update Dimensions if present (for basic alarms)
+        self._update_dimensions(
+            template_config.get("Dimensions"), lambda_edge_function_name
+        )
 
-        except Exception as e:
-            self.logger.error(
-                f"Failed to parse Lambda ARN for alarm configuration: "
-                f"{resource.arn} - {str(e)}"
-            )
-            return None
+        # Update Metrics dimensions if present (for metric math alarms)
+        self._update_metrics_dimensions(
+            template_config.get("Metrics"), lambda_edge_function_name
+        )
 
         # Add region suffix to alarm name for Lambda@Edge
         # Pattern: IDR-Lambda-ErrorRate-function-name-region
@@ -264,30 +270,6 @@ class LambdaEdgeProcessor:
 
         return config
 
-    def _get_lambda_edge_function_name(
-        self, function_name: str, metric_region: str
-    ) -> str:
-        """Get the appropriate FunctionName for Lambda@Edge metrics.
-
-        Lambda@Edge metrics always use the prefixed format "us-east-1.{functionName}"
-        in ALL regions, including us-east-1 itself. This is because Lambda@Edge
-        functions are always deployed from us-east-1 and CloudWatch uses this
-        prefix consistently.
-
-        Args:
-            function_name: Raw function name from ARN
-            metric_region: Region where metrics exist (used for logging)
-
-        Returns:
-            Function name formatted for CloudWatch dimensions
-        """
-        prefixed_name = f"us-east-1.{function_name}"
-        self.logger.debug(
-            f"Using prefixed function name for region {metric_region}: "
-            f"{prefixed_name}"
-        )
-        return prefixed_name
-
     def _update_dimensions(
         self, dimensions: Any, lambda_edge_function_name: str
     ) -> None:
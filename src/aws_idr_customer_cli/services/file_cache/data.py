@@ -1,32 +1,58 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, config, dataclass_json
 from dateutil.parser import isoparse
-from marshmallow import fields
 
 from aws_idr_customer_cli.utils.constants import DiscoverMethod
+from aws_idr_customer_cli.utils.validate_alarm.alarm_validation_constants import (
+    STATUS_KEYWORD_APPROVED,
+)
+
+# Records built per resource or alarm, and the per-submission sections that
+# hold them, get generated __slots__ (Python 3.10+) so they carry no
+# per-instance __dict__. They stay mutable because sessions update them in
+# place. OnboardingSubmission is left unslotted: sessions attach transient
+# attributes such as alarm_arns to it.
+SLOTTED: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized for repeated values.
+
+    Cached files store datetime.isoformat() output, which the C-implemented
+    fromisoformat reads directly; other ISO 8601 forms fall back to isoparse.
+    Alarms created in one batch share timestamps, hence the cache.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return isoparse(value)
+
+
+@lru_cache(maxsize=128)
+def _is_passed_onboarding_status(onboarding_status: str) -> bool:
+    """Check a status wording for approval once per distinct wording."""
+    return onboarding_status == "Y" or STATUS_KEYWORD_APPROVED in onboarding_status
 
 
 def datetime_field(required: bool = True) -> Any:
     """Create a datetime field with consistent JSON serialization."""
     if required:
         return field(
-            metadata=config(
-                encoder=datetime.isoformat,
-                decoder=isoparse,
-                mm_field=fields.DateTime(format="iso"),
-            )
+            metadata=config(encoder=datetime.isoformat, decoder=parse_iso_datetime)
         )
     else:
         return field(
             default=None,
             metadata=config(
                 encoder=lambda x: x.isoformat() if x else None,
-                decoder=lambda x: isoparse(x) if x else None,
-                mm_field=fields.DateTime(format="iso", allow_none=True),
+                decoder=lambda x: parse_iso_datetime(x) if x else None,
             ),
         )
 
@@ -37,7 +63,7 @@ class OnboardingStatus(str, Enum):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class ProgressTracker:
     current_step: int = 0
     total_steps: int = 0
@@ -58,7 +84,7 @@ class CommandStatusTracker(DataClassJsonMixin):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class ResourceArn:
     type: str
     arn: str
@@ -67,7 +93,7 @@ class ResourceArn:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class ContactInfo:
     name: str
     email: str
@@ -75,14 +101,14 @@ class ContactInfo:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class AlarmContacts:
     primary_contact: ContactInfo
     escalation_contact: ContactInfo
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class WorkloadOnboard:
     support_case_id: Optional[str]
     name: str
@@ -94,13 +120,13 @@ class WorkloadOnboard:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class AlarmConfiguration:
     alarm_name: str
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class AlarmCreation:
     alarm_arn: Optional[str]
     is_selected: bool
@@ -112,7 +138,7 @@ class AlarmCreation:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class AlarmValidation:
     alarm_arn: str
     onboarding_status: str = "N"
@@ -124,11 +150,11 @@ class AlarmValidation:
     @property
     def is_validation_passed(self) -> bool:
         """Backward compatibility property."""
-        return self.onboarding_status == "Y" or "Approved" in self.onboarding_status
+        return _is_passed_onboarding_status(self.onboarding_status)
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class Contact:
     id: int
     name: str
@@ -137,14 +163,14 @@ class Contact:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class Escalation:
     sequence: List[int]
     time: int
 
 
 @dataclass_json
-@dataclass
+@dataclass(frozen=True, **SLOTTED)
 class OnboardingAlarm:
     alarm_arn: str
     primary_contact: ContactInfo
@@ -152,7 +178,7 @@ class OnboardingAlarm:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class AlarmIngestion:
     onboarding_alarms: List[OnboardingAlarm]
     contacts_approval_timestamp: datetime = datetime_field(required=True)
@@ -160,7 +186,7 @@ class AlarmIngestion:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class ApmEventSource:
     """Single EventBridge event source with validation status.
     Represents one APM data source (EventBridge) with its alert identifiers.
@@ -173,7 +199,7 @@ class ApmEventSource:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**SLOTTED)
 class ApmIngestion:
     """APM alert ingestion data with support for multiple EventBridge ARNs."""
 
@@ -93,7 +93,9 @@ class FileCacheService(FileCacheServiceInterface):
             data = submission.to_dict()
             data["filehash"] = calculate_dict_hash(data)
 
-            self.logger.info(f"[Tracing] Data cached: {data}")
+            # Lazy formatting: the full submission repr is only built when a
+            # handler actually emits the record
+            self.logger.info("[Tracing] Data cached: %s", data)
 
             # JSON -> compress -> encrypt -> save
             json_bytes = json.dumps(data, default=str).encode("utf-8")
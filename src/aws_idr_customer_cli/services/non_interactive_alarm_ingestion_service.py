@@ -1,4 +1,5 @@
 import json
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -13,6 +14,7 @@ from aws_idr_customer_cli.input.input_resource_discovery import InputResourceDis
 from aws_idr_customer_cli.models.non_interactive_config import (
     AlarmContactsConfig,
     AlarmIngestionConfig,
+    DiscoveryMethod,
     OutputFormat,
 )
 from aws_idr_customer_cli.services.create_alarm.alarm_service import AlarmService
@@ -64,6 +66,13 @@ from aws_idr_customer_cli.utils.validation.validator import Validate
 class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
     """Service for non-interactive alarm ingestion."""
 
+    # Same as the base output, but KEEP alarm_validation for ingestion
+    JSON_OUTPUT_EXCLUDED_FIELDS = tuple(
+        name
+        for name in NonInteractiveServiceBase.JSON_OUTPUT_EXCLUDED_FIELDS
+        if name != "alarm_validation"
+    )
+
     @inject
     def __init__(
         self,
@@ -134,9 +143,11 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
         """Execute complete alarm ingestion from config data."""
         config_obj = AlarmIngestionConfig.from_dict(config)
         json_output: Dict[str, Any] = {}
-        is_json_mode = config_obj.options.output_format == OutputFormat.JSON
+        is_json_mode = config_obj.options.output_format is OutputFormat.JSON
         try:
-            submission = self.execute_from_config(config=config, account_id=account_id)
+            submission = self.execute_from_config(
+                config_obj=config_obj, account_id=account_id
+            )
             if is_json_mode:
                 json_output["status"] = "success"
                 json_output["data"] = self._create_filtered_json_output(
@@ -156,10 +167,9 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
                     )
 
     def execute_from_config(
-        self, config: Dict[str, Any], account_id: str
+        self, config_obj: AlarmIngestionConfig, account_id: str
     ) -> OnboardingSubmission:
         """Execute alarm ingestion from config data."""
-        config_obj = AlarmIngestionConfig.from_dict(config)
         self.set_output_format(output_format=config_obj.options.output_format)
         dry_run_mode = config_obj.options.dry_run
 
@@ -175,9 +185,13 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
             discovery_config=config_obj.discovery,
         )
 
+        # Contacts are approved through the config, so one timestamp covers
+        # session creation and the contacts approval moment
+        now = datetime.now(timezone.utc)
+
         # Setup initial data
         workload, alarm_contacts, temp_submission = self._setup_initial_data(
-            config_obj=config_obj, account_id=account_id
+            config_obj=config_obj, account_id=account_id, now=now
         )
         display_alarm_contact_summary(ui=self.ui, submission=temp_submission)
 
@@ -216,12 +230,13 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
                 submission=submission,
                 alarm_validations=alarm_validations,
                 alarm_contacts=alarm_contacts,
+                now=now,
             )
         elif apm_data and not submission.alarm_ingestion:
             # For APM-only configurations, create empty alarm ingestion with timestamp
             submission.alarm_ingestion = AlarmIngestion(
                 onboarding_alarms=[],
-                contacts_approval_timestamp=datetime.now(timezone.utc),
+                contacts_approval_timestamp=now,
             )
         self.store.update(session_id=session_id, submission=submission)
 
@@ -245,7 +260,7 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
         return submission
 
     def _setup_initial_data(
-        self, config_obj: AlarmIngestionConfig, account_id: str
+        self, config_obj: AlarmIngestionConfig, account_id: str, now: datetime
     ) -> tuple:
         """Setup initial workload and contact data."""
         workload = self._create_workload_data(
@@ -254,15 +269,14 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
         alarm_contacts = self._create_alarm_contact_data(
             contacts_config=config_obj.contacts
         )
-        current_time = datetime.now(timezone.utc)
         temp_submission = OnboardingSubmission(
             filehash="",
             schema_version=SCHEMA_VERSION,
             idr_cli_version=CLI_VERSION,
             account_id=account_id,
             status=OnboardingStatus.IN_PROGRESS,
-            created_at=current_time,
-            last_updated_at=current_time,
+            created_at=now,
+            last_updated_at=now,
             alarm_contacts=alarm_contacts,
         )
         return workload, alarm_contacts, temp_submission
@@ -271,7 +285,7 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
         self, config_obj: AlarmIngestionConfig
     ) -> List[str]:
         """Discover alarms and display progress."""
-        if config_obj.discovery.method.value == "arns":
+        if config_obj.discovery.method is DiscoveryMethod.ARNS:
             self.ui.display_info(
                 f"\n🔍 Loading {len(config_obj.discovery.arns)} alarm(s) from ARNs..."
             )
@@ -329,11 +343,8 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
             validation_results_list = self._alarm_validator.validate_alarms(
                 alarm_arns=alarm_arns
             )
-            alarm_validations = []
-            validation_counts = {"valid": 0, "invalid": 0, "warnings": 0}
-
-            for result in validation_results_list:
-                alarm_validation = AlarmValidation(
+            alarm_validations = [
+                AlarmValidation(
                     alarm_arn=result.alarm_arn,
                     onboarding_status=result.onboarding_status,
                     is_noisy=result.is_noisy,
@@ -341,28 +352,26 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
                     remarks_for_idr=result.remarks_for_idr,
                     noise_analysis={},
                 )
-                alarm_validations.append(alarm_validation)
+                for result in validation_results_list
+            ]
 
-                if result.status == ValidationStatus.YES:
-                    validation_counts["valid"] += 1
-                elif result.status == ValidationStatus.NO:
-                    validation_counts["invalid"] += 1
-                else:
-                    validation_counts["warnings"] += 1
+            status_counts = Counter(result.status for result in validation_results_list)
+            valid_count = status_counts[ValidationStatus.YES]
+            invalid_count = status_counts[ValidationStatus.NO]
+            warning_count = len(validation_results_list) - valid_count - invalid_count
 
             submission.alarm_validation = alarm_validations
             self.ui.display_info(
-                f"✅ Validation: {validation_counts['valid']} valid, "
-                f"{validation_counts['invalid']} invalid, "
-                f"{validation_counts['warnings']} warnings",
+                f"✅ Validation: {valid_count} valid, "
+                f"{invalid_count} invalid, "
+                f"{warning_count} warnings",
                 style="green",
             )
             return alarm_validations
         except Exception as e:
             self.ui.display_warning(f"Validation failed: {type(e).__name__}: {str(e)}")
-            import traceback
-
-            self.ui.display_warning(traceback.format_exc())
+            # Traceback is only formatted when debug logging is enabled
+            self.logger.debug("Alarm validation failed", exc_info=True)
             raise
         finally:
             self._alarm_validator.ui.set_silent_mode(False)
@@ -372,6 +381,7 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
         submission: OnboardingSubmission,
         alarm_validations: List[AlarmValidation],
         alarm_contacts: AlarmContacts,
+        now: datetime,
     ) -> None:
         """Populate alarm ingestion data in submission."""
         onboarding_alarms = [
@@ -384,7 +394,7 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
         ]
         submission.alarm_ingestion = AlarmIngestion(
             onboarding_alarms=onboarding_alarms,
-            contacts_approval_timestamp=datetime.now(timezone.utc),
+            contacts_approval_timestamp=now,
         )
 
     def _handle_post_validation_tasks(
@@ -436,7 +446,7 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
 
     def _discover_alarms(self, discovery_config: Any, regions: List[str]) -> List[str]:
         """Discover alarms based on configuration."""
-        if discovery_config.method.value == "tags":
+        if discovery_config.method is DiscoveryMethod.TAGS:
             if not discovery_config.tags:
                 raise ValueError("Tags required for tag-based discovery")
 
@@ -457,11 +467,10 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
                 return []
 
             # Extract ARN strings
-            alarm_arns: List[str] = [
-                r["ResourceArn"].arn for r in resources if "ResourceArn" in r
-            ]
+            resource_arns = (r.get("ResourceArn") for r in resources)
+            alarm_arns: List[str] = [ra.arn for ra in resource_arns if ra is not None]
             return alarm_arns
-        elif discovery_config.method.value == "arns":
+        elif discovery_config.method is DiscoveryMethod.ARNS:
             if not discovery_config.arns:
                 raise ValueError("ARNs required for ARN-based discovery")
             return list(discovery_config.arns)
@@ -483,15 +492,18 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
             return None
 
         # Get existing case ID if any
-        existing_case_id: Optional[str] = None
-        if submission.workload_onboard and submission.workload_onboard.support_case_id:
-            existing_case_id = submission.workload_onboard.support_case_id
+        workload_onboard = submission.workload_onboard
+        existing_case_id: Optional[str] = (
+            workload_onboard.support_case_id if workload_onboard else None
+        )
+
+        # Both the update and create paths read the submission from the cache
+        self._file_cache_service.file_cache = submission
+        self._support_case_service.file_cache_service.file_cache = submission
 
         try:
             if existing_case_id:
                 # Update existing case
-                self._file_cache_service.file_cache = submission
-                self._support_case_service.file_cache_service.file_cache = submission
                 self._support_case_service.update_case_with_attachment_set(
                     session_id=session_id, case_id=existing_case_id
                 )
@@ -501,14 +513,12 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
                 return existing_case_id
             else:
                 # Create new case
-                self._file_cache_service.file_cache = submission
-                self._support_case_service.file_cache_service.file_cache = submission
                 # create_case returns str
                 new_case_id: str = self._support_case_service.create_case(
                     session_id=session_id
                 )
-                if submission.workload_onboard:
-                    submission.workload_onboard.support_case_id = new_case_id
+                if workload_onboard:
+                    workload_onboard.support_case_id = new_case_id
                 self.ui.display_info(
                     f"✅ Support case created: {new_case_id}", style="green"
                 )
@@ -521,8 +531,8 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
                     self._support_case_service.update_case_with_attachment_set(
                         session_id=session_id, case_id=existing_case_id
                     )
-                    if submission.workload_onboard:
-                        submission.workload_onboard.support_case_id = existing_case_id
+                    if workload_onboard:
+                        workload_onboard.support_case_id = existing_case_id
                     self.ui.display_info(
                         "✅ Support case updated successfully", style="green"
                     )
@@ -532,10 +542,7 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
             self.ui.display_warning(
                 f"⚠️  Support case handling failed: {type(e).__name__}: {str(e)}"
             )
-            import traceback
-
-            if self._should_display_ui():
-                self.ui.display_warning(traceback.format_exc())
+            self.logger.debug("Support case handling failed", exc_info=True)
             return None
 
     def _handle_service_linked_role(self, dry_run_mode: bool = False) -> bool:
@@ -603,27 +610,6 @@ class NonInteractiveAlarmIngestionService(NonInteractiveServiceBase):
 
         self.ui.display_result("📋 Alarm ingestion summary", summary_data)
 
-    def _create_filtered_json_output(
-        self, submission: OnboardingSubmission
-    ) -> Dict[str, Any]:
-        """Create filtered JSON output for alarm ingestion, keeping validation data."""
-        json_data = submission.to_dict()
-
-        # Remove unnecessary fields but KEEP alarm_validation for ingestion
-        unnecessary_fields = [
-            "filehash",
-            "progress",
-            "progress_tracker",
-            "workload_to_alarm_handoff",
-            "resource_discovery_methods",
-            "resource_tags",
-        ]
-
-        for field in unnecessary_fields:
-            json_data.pop(field, None)
-
-        return dict(json_data)
-
     def _validate_mixed_config(self, config_obj: AlarmIngestionConfig) -> None:
         """Validate mixed configuration requirements."""
         has_cloudwatch = config_obj.discovery is not None
@@ -118,12 +118,12 @@ class NonInteractiveAlarmService(NonInteractiveServiceBase):
         json_output = {}
         try:
             submission = self.execute_from_config(config, account_id)
-            if config_obj.options.output_format == OutputFormat.JSON:
+            if config_obj.options.output_format is OutputFormat.JSON:
                 json_output["status"] = "success"
                 json_output["data"] = self._create_filtered_json_output(submission)
                 print(json.dumps(json_output, indent=2))
         except Exception as e:
-            if config_obj.options.output_format == OutputFormat.JSON:
+            if config_obj.options.output_format is OutputFormat.JSON:
                 json_output["status"] = "failed"
                 json_output["error"] = str(e)
                 print(json.dumps(json_output, indent=2))
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from dataclasses import fields, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from injector import inject
 
@@ -45,10 +46,27 @@ from aws_idr_customer_cli.utils.workload_meta_data_collection_utils import (
     display_workload_info_summary,
 )
 
+# Submission fields that default to None, and so can be blanked before
+# serializing instead of being converted and then discarded
+_NULLABLE_SUBMISSION_FIELDS = frozenset(
+    f.name for f in fields(OnboardingSubmission) if f.default is None
+)
+
 
 class NonInteractiveServiceBase(ABC):
     """Base class for non-interactive services providing common functionality."""
 
+    # Submission fields left out of non-interactive JSON output
+    JSON_OUTPUT_EXCLUDED_FIELDS: Tuple[str, ...] = (
+        "filehash",
+        "progress",
+        "progress_tracker",
+        "workload_to_alarm_handoff",
+        "alarm_validation",
+        "resource_discovery_methods",
+        "resource_tags",
+    )
+
     @inject
     def __init__(
         self,
@@ -71,12 +89,12 @@ class NonInteractiveServiceBase(ABC):
         """Set the output format for the service."""
         self._output_format = output_format
         # Enable silent mode on UI for JSON output
-        if self._output_format == OutputFormat.JSON:
+        if self._output_format is OutputFormat.JSON:
             self.ui.set_silent_mode(True)
 
     def _should_display_ui(self) -> bool:
         """Check if UI output should be displayed based on output format."""
-        return bool(self._output_format == OutputFormat.TEXT)
+        return self._output_format is OutputFormat.TEXT
 
     def _display_dry_run_header(self) -> None:
         """Display dry run mode header."""
@@ -125,7 +143,7 @@ class NonInteractiveServiceBase(ABC):
         if discovery_config:
             # Validate tags if using tag-based discovery
             if (
-                discovery_config.method == DiscoveryMethod.TAGS
+                discovery_config.method is DiscoveryMethod.TAGS
                 and discovery_config.tags
             ):
                 for tag_key, tag_value in discovery_config.tags.items():
@@ -134,7 +152,7 @@ class NonInteractiveServiceBase(ABC):
 
             # Validate ARNs if using ARN-based discovery
             elif (
-                discovery_config.method == DiscoveryMethod.ARNS
+                discovery_config.method is DiscoveryMethod.ARNS
                 and discovery_config.arns
             ):
                 for arn in discovery_config.arns:
@@ -169,7 +187,7 @@ class NonInteractiveServiceBase(ABC):
         self, discovery_config: DiscoveryConfig, regions: List[str]
     ) -> List[ResourceArn]:
         """Discover resources based on config."""
-        if discovery_config.method == DiscoveryMethod.TAGS and discovery_config.tags:
+        if discovery_config.method is DiscoveryMethod.TAGS and discovery_config.tags:
             # Use existing utility for tag-based discovery
             tag_filters = [
                 {"Key": k, "Values": [v]} for k, v in discovery_config.tags.items()
@@ -194,7 +212,7 @@ class NonInteractiveServiceBase(ABC):
 
             return resource_arns
 
-        elif discovery_config.method == DiscoveryMethod.ARNS and discovery_config.arns:
+        elif discovery_config.method is DiscoveryMethod.ARNS and discovery_config.arns:
             self.ui.display_info(
                 f"Using input ARNs: {len(discovery_config.arns)} specified"
             )
@@ -279,21 +297,16 @@ class NonInteractiveServiceBase(ABC):
     ) -> Dict[str, Any]:
         """Create filtered JSON output for non-interactive commands by removing
         unnecessary fields."""
-        # Convert submission to dict using existing method
-        json_data = submission.to_dict()
-
-        # Remove unnecessary fields for non-interactive JSON output
-        unnecessary_fields = [
-            "filehash",
-            "progress",
-            "progress_tracker",
-            "workload_to_alarm_handoff",
-            "alarm_validation",
-            "resource_discovery_methods",
-            "resource_tags",
-        ]
-
-        for field in unnecessary_fields:
+        # Blank excluded optional fields on a shallow copy so their nested
+        # objects (e.g. one entry per validated alarm) are never serialized
+        blanked = {
+            name: None
+            for name in self.JSON_OUTPUT_EXCLUDED_FIELDS
+            if name in _NULLABLE_SUBMISSION_FIELDS
+        }
+        json_data = replace(submission, **blanked).to_dict()
+
+        for field in self.JSON_OUTPUT_EXCLUDED_FIELDS:
             json_data.pop(field, None)
 
         return dict(json_data)
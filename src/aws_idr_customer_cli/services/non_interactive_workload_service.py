@@ -66,12 +66,12 @@ class NonInteractiveWorkloadService(NonInteractiveServiceBase):
         json_output = dict()
         try:
             submission = self.execute_from_config(config_obj, account_id)
-            if config_obj.options.output_format == OutputFormat.JSON:
+            if config_obj.options.output_format is OutputFormat.JSON:
                 json_output["status"] = "success"
                 json_output["data"] = self._create_filtered_json_output(submission)
                 print(json.dumps(json_output, indent=2))
         except Exception as e:
-            if config_obj.options.output_format == OutputFormat.JSON:
+            if config_obj.options.output_format is OutputFormat.JSON:
                 json_output["status"] = "failed"
                 json_output["error"] = str(e)
                 print(json.dumps(json_output, indent=2))
@@ -34,11 +34,20 @@ from aws_idr_customer_cli.services.non_interactive_base_service import (
     NonInteractiveServiceBase,
 )
 from aws_idr_customer_cli.services.support_case_service import SupportCaseService
-from aws_idr_customer_cli.utils.constants import CLI_VERSION, SCHEMA_VERSION, UpdateType
+from aws_idr_customer_cli.utils.constants import (
+    CLI_VERSION,
+    SCHEMA_VERSION,
+    UPDATE_TYPE_DISPLAY_NAMES,
+    UpdateType,
+)
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 from aws_idr_customer_cli.utils.session.session_store import SessionStore
 from aws_idr_customer_cli.utils.validation.validator import Validate
 
+# Config update_type is a plain string; compare against the enum values directly
+UPDATE_TYPE_CONTACTS = UpdateType.CONTACTS.value
+UPDATE_TYPE_ALARMS = UpdateType.ALARMS.value
+
 
 class NonInteractiveWorkloadUpdateService(NonInteractiveServiceBase):
     """Service for non-interactive workload update."""
@@ -75,31 +84,30 @@ class NonInteractiveWorkloadUpdateService(NonInteractiveServiceBase):
     ) -> None:
         """Execute complete workload update from config data."""
         config_obj = WorkloadUpdateConfig.from_dict(config)  # type: ignore[attr-defined]
+        if config_obj.options.output_format is not OutputFormat.JSON:
+            self.execute_from_config(config_obj=config_obj, account_id=account_id)
+            return
+
         json_output: Dict[str, Any] = {}
-        is_json_mode = config_obj.options.output_format == OutputFormat.JSON
         try:
-            submission = self.execute_from_config(config=config, account_id=account_id)
-            if is_json_mode:
-                json_output["status"] = "success"
-                json_output["data"] = self._create_filtered_json_output(submission)
+            submission = self.execute_from_config(
+                config_obj=config_obj, account_id=account_id
+            )
+            json_output["status"] = "success"
+            json_output["data"] = self._create_filtered_json_output(submission)
         except Exception as e:
-            if is_json_mode:
-                json_output["status"] = "failed"
-                json_output["error"] = str(e)
-            else:
-                raise e
+            json_output["status"] = "failed"
+            json_output["error"] = str(e)
         finally:
-            if is_json_mode:
-                with self.ui.unsilenced_output():
-                    self.ui.display_info(
-                        json.dumps(json_output, indent=2, ensure_ascii=False)
-                    )
+            with self.ui.unsilenced_output():
+                self.ui.display_info(
+                    json.dumps(json_output, indent=2, ensure_ascii=False)
+                )
 
     def execute_from_config(
-        self, config: Dict[str, Any], account_id: str
+        self, config_obj: WorkloadUpdateConfig, account_id: str
     ) -> OnboardingSubmission:
-        """Execute workload update from config data."""
-        config_obj = WorkloadUpdateConfig.from_dict(config)  # type: ignore[attr-defined]
+        """Execute workload update from parsed config."""
         self.set_output_format(config_obj.options.output_format)
 
         # Validate config
@@ -119,7 +127,7 @@ class NonInteractiveWorkloadUpdateService(NonInteractiveServiceBase):
         case_id = self._support_case_service.create_update_request_case(
             session_id=session_id,
             workload_name=config_obj.workload_name,
-            update_type=UpdateType(config_obj.update_type).display_name,
+            update_type=UPDATE_TYPE_DISPLAY_NAMES[config_obj.update_type],
         )
 
         # Update submission with case ID
@@ -160,19 +168,22 @@ class NonInteractiveWorkloadUpdateService(NonInteractiveServiceBase):
         )
 
         # Add contacts if provided (contacts update)
-        if config.update_type == UpdateType.CONTACTS.value and config.contacts:
+        if config.update_type == UPDATE_TYPE_CONTACTS and config.contacts:
             submission.alarm_contacts = self._create_alarm_contacts(config.contacts)
 
         # Add alarms if provided (alarms update)
-        if config.update_type == UpdateType.ALARMS.value:
+        if config.update_type == UPDATE_TYPE_ALARMS:
             if config.discovery:
                 alarm_arns = self._get_alarm_arns(config)
                 if alarm_arns:
+                    # Update alarms carry no per-alarm contacts; share one
+                    # placeholder across this submission's alarms
+                    empty_contact = ContactInfo(name="", email="", phone="")
                     onboarding_alarms = [
                         OnboardingAlarm(
                             alarm_arn=arn,
-                            primary_contact=ContactInfo(name="", email="", phone=""),
-                            escalation_contact=ContactInfo(name="", email="", phone=""),
+                            primary_contact=empty_contact,
+                            escalation_contact=empty_contact,
                         )
                         for arn in alarm_arns
                     ]
@@ -219,10 +230,11 @@ class NonInteractiveWorkloadUpdateService(NonInteractiveServiceBase):
         if not config.discovery:
             return []
 
-        if config.discovery.method == DiscoveryMethod.TAGS and config.discovery.tags:
+        if config.discovery.method is DiscoveryMethod.TAGS and config.discovery.tags:
             return self._discover_alarms_by_tags(config)
         elif config.discovery.arns:
-            return list(config.discovery.arns)
+            # Already a list parsed from the config; no need to copy it
+            return config.discovery.arns
         return []
 
     def _validate_config(self, config: WorkloadUpdateConfig) -> None:
@@ -230,14 +242,13 @@ class NonInteractiveWorkloadUpdateService(NonInteractiveServiceBase):
         if not config.workload_name:
             raise ValueError("workload_name is required")
 
-        valid_types = (UpdateType.CONTACTS.value, UpdateType.ALARMS.value)
-        if config.update_type not in valid_types:
+        if config.update_type not in (UPDATE_TYPE_CONTACTS, UPDATE_TYPE_ALARMS):
             raise ValueError("update_type must be 'contacts' or 'alarms'")
 
-        if config.update_type == UpdateType.CONTACTS.value and not config.contacts:
+        if config.update_type == UPDATE_TYPE_CONTACTS and not config.contacts:
             raise ValueError("contacts is required when update_type is 'contacts'")
 
-        if config.update_type == UpdateType.ALARMS.value:
+        if config.update_type == UPDATE_TYPE_ALARMS:
             if not config.discovery and not config.third_party_apm:
                 raise ValueError(
                     "discovery or third_party_apm is required "
@@ -264,8 +275,7 @@ class NonInteractiveWorkloadUpdateService(NonInteractiveServiceBase):
         if not resources:
             return []
 
-        alarm_arns: List[str] = [
-            r["ResourceArn"].arn for r in resources if "ResourceArn" in r
-        ]
+        resource_arns = (r.get("ResourceArn") for r in resources)
+        alarm_arns: List[str] = [ra.arn for ra in resource_arns if ra is not None]
         self._logger.info(f"Discovered {len(alarm_arns)} alarms by tags")
         return alarm_arns
@@ -1,5 +1,7 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from injector import inject
 
@@ -30,6 +32,14 @@ from aws_idr_customer_cli.utils.feature_flags import (
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 
 
+@lru_cache(maxsize=8)
+def _case_config_for(stage: Stage, config_key: str) -> Mapping[str, str]:
+    """Resolve a read-only support case config section for a stage."""
+    feature_configs = FeatureFlags._FEATURE_CONFIGS.get(Feature.MVP, {})
+    stage_config = feature_configs.get(stage, {})
+    return MappingProxyType(stage_config.get(config_key, {}))
+
+
 class SupportCaseService:
     """Support Case functionality creation"""
 
@@ -229,16 +239,14 @@ class SupportCaseService:
 
     def get_duplicate_case_id(self, subject: str) -> str:
         """Check if a case with the given subject already exists and return its case ID"""
-        cases = self.accessor.describe_cases(include_resolved_cases=False)
-        for case in cases:
-            if case.get("subject") == subject:
-                case_id = case.get("caseId", "")
-                self.logger.debug(
-                    f"Found existing case with subject '{subject}' "
-                    f"and case ID: {case_id}"
-                )
-                return str(case_id)
-        return ""
+        case = self.accessor.find_open_case_by_subject(subject)
+        if not case:
+            return ""
+        case_id = case.get("caseId", "")
+        self.logger.debug(
+            f"Found existing case with subject '{subject}' and case ID: {case_id}"
+        )
+        return str(case_id)
 
     def is_case_resolved(self, case_id: str) -> bool:
         """Check if a support case is resolved/closed.
@@ -340,44 +348,39 @@ class SupportCaseService:
             return Stage.DEV
         return FeatureFlags.get_stage(Feature.MVP)
 
-    def _get_support_case_config(self) -> Dict[str, str]:
+    def _get_support_case_config(self) -> Mapping[str, str]:
         """Get support case configuration for the effective stage.
 
         Returns:
-            Configuration dictionary for support case fields
+            Configuration mapping for support case fields
         """
-        effective_stage = self._get_effective_stage()
-        feature_configs = FeatureFlags._FEATURE_CONFIGS.get(Feature.MVP, {})
-        stage_config = feature_configs.get(effective_stage, {})
-        config = stage_config.get(SUPPORT_CASE_KEY, {})
-
-        return cast(Dict[str, str], config)
+        return _case_config_for(self._get_effective_stage(), SUPPORT_CASE_KEY)
 
     def _get_severity(self) -> str:
         """Get severity value from feature flags using effective stage."""
         config = self._get_support_case_config()
-        severity = cast(str, config["severity"])
+        severity = config["severity"]
         self.logger.info(f"Using support case severity: '{severity}'")
         return severity
 
     def _get_category(self) -> str:
         """Get category value from feature flags using effective stage."""
         config = self._get_support_case_config()
-        category = cast(str, config["category"])
+        category = config["category"]
         self.logger.info(f"Using support case category: '{category}'")
         return category
 
     def _get_issue_type(self) -> str:
         """Get issue type value from feature flags using effective stage."""
         config = self._get_support_case_config()
-        issue_type = cast(str, config["issue_type"])
+        issue_type = config["issue_type"]
         self.logger.info(f"Using support case issue_type: '{issue_type}'")
         return issue_type
 
     def _get_language(self) -> str:
         """Get language value from feature flags using effective stage."""
         config = self._get_support_case_config()
-        language = cast(str, config["language"])
+        language = config["language"]
         self.logger.info(f"Using support case language: '{language}'")
         return language
 
@@ -388,20 +391,17 @@ class SupportCaseService:
             Service code for support case routing
         """
         config = self._get_support_case_config()
-        service_code = cast(str, config["service_code"])
+        service_code = config["service_code"]
         self.logger.info(f"Using support case service_code: '{service_code}'")
         return service_code
 
-    def _get_update_case_config(self) -> Dict[str, str]:
+    def _get_update_case_config(self) -> Mapping[str, str]:
         """Get update case configuration for the effective stage.
 
         Uses _get_effective_stage() which returns Stage.DEV when --test-mode
         is enabled, routing to test CTI instead of production.
         """
-        effective_stage = self._get_effective_stage()
-        feature_configs = FeatureFlags._FEATURE_CONFIGS.get(Feature.MVP, {})
-        stage_config = feature_configs.get(effective_stage, {})
-        return cast(Dict[str, str], stage_config.get(UPDATE_CASE_KEY, {}))
+        return _case_config_for(self._get_effective_stage(), UPDATE_CASE_KEY)
 
     def _build_contact_details(self, submission: Optional[OnboardingSubmission]) -> str:
         """Build contact details string for update request message."""
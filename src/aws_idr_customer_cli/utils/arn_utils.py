@@ -19,6 +19,22 @@ def extract_account_id_from_arn(resource_arn: str) -> str:
     return str(arn.account_id)
 
 
+def extract_region_from_arn(resource_arn: str) -> str:
+    """
+    Extract the region from an ARN without building a parsed ARN object.
+
+    Args:
+        resource_arn: ARN string
+
+    Returns:
+        Region string, empty for global resources such as S3 buckets
+    """
+    parts = resource_arn.split(":", 5)
+    if len(parts) < 6 or parts[0] != "arn":
+        raise ValueError(f"Invalid ARN: {resource_arn}")
+    return parts[3]
+
+
 def extract_resource_id_from_arn(resource_arn: str) -> str:
     """
     Extract resource ID from ARN.
@@ -0,0 +1,24 @@
+"""Process-wide boto3 session."""
+
+import threading
+from functools import cache
+from typing import Any
+
+import boto3
+
+# boto3 sessions are not thread-safe for client creation, and clients may now
+# be created from background threads (e.g. start-up warm-up), so every client
+# built from the shared session goes through this lock.
+_CLIENT_CREATION_LOCK = threading.Lock()
+
+
+@cache
+def get_aws_session() -> boto3.session.Session:
+    """Shared boto3 session so credentials are resolved once per process."""
+    return boto3.session.Session()
+
+
+def create_session_client(service: str, **kwargs: Any) -> Any:
+    """Create a client from the shared session, serialized across threads."""
+    with _CLIENT_CREATION_LOCK:
+        return get_aws_session().client(service, **kwargs)  # type: ignore
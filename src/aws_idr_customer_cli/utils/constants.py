@@ -81,9 +81,14 @@ class UpdateType(str, Enum):
     @property
     def display_name(self) -> str:
         """Display name for UI."""
-        if self == UpdateType.CONTACTS:
-            return "Contacts/Escalation"
-        return "Alarms"
+        return UPDATE_TYPE_DISPLAY_NAMES[self.value]
+
+
+# Display names keyed by the raw update_type string used in configs
+UPDATE_TYPE_DISPLAY_NAMES = {
+    UpdateType.CONTACTS.value: "Contacts/Escalation",
+    UpdateType.ALARMS.value: "Alarms",
+}
 
 
 # Default AWS region
@@ -148,15 +148,18 @@ class ConditionalMetricValidator:
         metric_name: str,
     ) -> bool:
         """Check if any subscription has the specified property configured."""
-        response = self.sns_accessor.list_subscriptions_by_topic(topic_arn, region)
-        subscriptions: List[Dict[str, Any]] = response.get("Subscriptions", [])
-
-        for subscription in subscriptions:
+        subscription_arns: List[str] = []
+        for subscription in self.sns_accessor.iter_subscriptions_by_topic(
+            topic_arn, region
+        ):
             sub_arn = subscription.get("SubscriptionArn")
             if not sub_arn or sub_arn == "PendingConfirmation":
                 continue
+            subscription_arns.append(sub_arn)
 
-            attrs = self.sns_accessor.get_subscription_attributes(sub_arn, region)
+        for attrs in self.sns_accessor.iter_subscription_attributes(
+            subscription_arns, region
+        ):
             if property_name in attrs:
                 return True
 
@@ -290,8 +293,12 @@ class ConditionalMetricValidator:
             bucket_name = parsed_arn.resource
 
             try:
-                metrics = self.s3_accessor.list_bucket_metrics_configurations(
-                    bucket_name, region
+                # Only existence matters, so stop after the first configuration
+                first_config = next(
+                    self.s3_accessor.iter_bucket_metrics_configurations(
+                        bucket_name, region
+                    ),
+                    None,
                 )
             except Exception as e:
                 self.alarm_accessor.logger.warning(
@@ -301,7 +308,7 @@ class ConditionalMetricValidator:
                 )
                 return False
 
-            has_metrics = len(metrics) > 0
+            has_metrics = first_config is not None
 
             if not has_metrics:
                 self.alarm_accessor.logger.warning(
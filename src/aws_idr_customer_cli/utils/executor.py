@@ -0,0 +1,17 @@
+"""Shared thread pool for concurrent AWS API calls."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from aws_idr_customer_cli.utils.constants import MAX_PARALLEL_WORKERS
+
+# Process-wide executor reused by every accessor fan-out. Threads are created
+# lazily on first submit and kept alive between calls, so repeated scans do
+# not pay thread start-up cost and keep their HTTP connections warm.
+# concurrent.futures joins the workers at interpreter exit, so no explicit
+# shutdown is registered here.
+#
+# Tasks submitted here must not block on other tasks submitted here, or the
+# pool can deadlock once every worker is waiting.
+SHARED_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_PARALLEL_WORKERS, thread_name_prefix="idr-accessor"
+)
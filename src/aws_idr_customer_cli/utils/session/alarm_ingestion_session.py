@@ -28,7 +28,7 @@ from aws_idr_customer_cli.utils.apm.apm_constants import (
     EVENTBRIDGE_NO_BUSES_ERROR,
     IDR_EVENTBRIDGE_NAME_PATTERN,
 )
-from aws_idr_customer_cli.utils.arn_utils import build_resource_arn_object
+from aws_idr_customer_cli.utils.arn_utils import extract_region_from_arn
 from aws_idr_customer_cli.utils.constants import (
     DEFAULT_REGION,
     AlarmInputMethod,
@@ -547,16 +547,17 @@ class AlarmIngestionSession(InteractiveSession):
             regions = set()
             for arn in result:
                 try:
-                    resource_arn = build_resource_arn_object(arn)
-                    if resource_arn.region and resource_arn.region != "global":
-                        regions.add(resource_arn.region)
+                    region = extract_region_from_arn(arn)
+                    if region:
+                        regions.add(region)
                 except Exception as e:
                     self.ui.display_warning(f"Failed to parse ARN {arn}: {e}")
 
             if regions and self.submission.workload_onboard:
-                self.submission.workload_onboard.regions = sorted(list(regions))
+                sorted_regions = sorted(regions)
+                self.submission.workload_onboard.regions = sorted_regions
                 self.ui.display_info(
-                    f"📍 Detected regions: {', '.join(sorted(regions))}"
+                    f"📍 Detected regions: {', '.join(sorted_regions)}"
                 )
 
         return {}
@@ -698,19 +699,16 @@ class AlarmIngestionSession(InteractiveSession):
             validation_results = []
 
         # Convert to AlarmValidation objects for cache
-        alarm_validations = []
-
-        for result in validation_results:
-            alarm_validation = AlarmValidation(
+        self.submission.alarm_validation = [
+            AlarmValidation(
                 alarm_arn=result.alarm_arn,
                 onboarding_status=result.onboarding_status,
                 is_noisy=result.is_noisy,
                 remarks_for_customer=result.remarks_for_customer,
                 remarks_for_idr=result.remarks_for_idr,
             )
-            alarm_validations.append(alarm_validation)
-
-        self.submission.alarm_validation = alarm_validations
+            for result in validation_results
+        ]
 
         # Create AlarmCreation objects
         alarm_creations = []
@@ -185,17 +185,17 @@ class UpdateSession(InteractiveSession):
             self.ui.display_info(f"✅ Collected {len(alarm_arns)} alarm ARN(s)")
 
             # Extract regions from ARNs (same as alarm_ingestion_session)
-            from aws_idr_customer_cli.utils.arn_utils import build_resource_arn_object
+            from aws_idr_customer_cli.utils.arn_utils import extract_region_from_arn
 
             region_set: set[str] = set()
             for arn in alarm_arns:
                 try:
-                    resource_arn = build_resource_arn_object(arn)
-                    if resource_arn.region and resource_arn.region != "global":
-                        region_set.add(resource_arn.region)
+                    region = extract_region_from_arn(arn)
+                    if region:
+                        region_set.add(region)
                 except Exception:
                     pass
-            regions = sorted(list(region_set))
+            regions = sorted(region_set)
             if regions:
                 self.ui.display_info(f"📍 Detected regions: {', '.join(regions)}")
 
@@ -207,11 +207,13 @@ class UpdateSession(InteractiveSession):
             self.submission.workload_onboard.regions = regions
 
         # Store in alarm_ingestion with workflow_type="update"
+        # Update alarms carry no per-alarm contacts; share one placeholder
+        empty_contact = ContactInfo(name="", email="", phone="")
         onboarding_alarms = [
             OnboardingAlarm(
                 alarm_arn=arn,
-                primary_contact=ContactInfo(name="", email="", phone=""),
-                escalation_contact=ContactInfo(name="", email="", phone=""),
+                primary_contact=empty_contact,
+                escalation_contact=empty_contact,
             )
             for arn in alarm_arns
         ]
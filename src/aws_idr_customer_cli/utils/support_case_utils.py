@@ -5,10 +5,12 @@ from aws_idr_customer_cli.core.interactive.ui import InteractiveUI
 from aws_idr_customer_cli.exceptions import SupportCaseAlreadyExistsError
 from aws_idr_customer_cli.services.support_case_service import SupportCaseService
 
+CASE_ID_PATTERN = re.compile(r"case ID:\s*([^\s\n.]+)")
+
 
 def extract_case_id_from_error(error_message: str) -> Optional[str]:
     """Extract support case ID from SupportCaseAlreadyExistsError message."""
-    match = re.search(r"case ID:\s*([^\s\n.]+)", error_message)
+    match = CASE_ID_PATTERN.search(error_message)
     if match:
         return match.group(1)
     return None
@@ -6,21 +6,26 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set
 
-import boto3
 from dateutil import parser
 from injector import inject
 
 from aws_idr_customer_cli.core.decorators import retry_on_throttle
 from aws_idr_customer_cli.core.interactive.ui import InteractiveUI
-from aws_idr_customer_cli.data_accessors.alarm_accessor import AlarmAccessor
+from aws_idr_customer_cli.data_accessors.alarm_accessor import (
+    DESCRIBE_ALARMS_MAX_RECORDS,
+    AlarmAccessor,
+)
 from aws_idr_customer_cli.utils.log_handlers import CliLogger
 from aws_idr_customer_cli.utils.validate_alarm.alarm_validation_constants import (
     CRITICAL_METRICS,
     INFRASTRUCTURE_KEYWORDS,
     NON_PROD_KEYWORDS,
     SKIP_PERIOD_CHECK_METRICS,
+    STATUS_KEYWORD_APPROVED,
+    STATUS_KEYWORD_CANNOT_ONBOARD,
     UNSUITABLE_METRICS,
 )
 from aws_idr_customer_cli.utils.validate_alarm.alarm_validation_models import (
@@ -34,6 +39,21 @@ class OnboardingStatus(Enum):
     NEEDS_CONFIRMATION = "NCC"
 
 
+@lru_cache(maxsize=128)
+def classify_onboarding_status(onboarding_status: str) -> OnboardingStatus:
+    """Map an onboarding status wording to its status enum.
+
+    Wordings come from a small fixed set, so each distinct one is only
+    scanned for its keyword once per process.
+    """
+    if STATUS_KEYWORD_APPROVED in onboarding_status or onboarding_status == "Y":
+        return OnboardingStatus.YES
+    elif STATUS_KEYWORD_CANNOT_ONBOARD in onboarding_status or onboarding_status == "N":
+        return OnboardingStatus.NO
+    else:
+        return OnboardingStatus.NEEDS_CONFIRMATION
+
+
 @dataclass
 class ValidationResult:
     alarm_arn: str
@@ -52,15 +72,7 @@ class ValidationResult:
     @property
     def status(self) -> OnboardingStatus:
         """Extract status enum from onboarding_status string."""
-        if "Approved" in self.onboarding_status or self.onboarding_status == "Y":
-            return OnboardingStatus.YES
-        elif (
-            "Cannot be onboarded" in self.onboarding_status
-            or self.onboarding_status == "N"
-        ):
-            return OnboardingStatus.NO
-        else:
-            return OnboardingStatus.NEEDS_CONFIRMATION
+        return classify_onboarding_status(self.onboarding_status)
 
     @property
     def recommendations(self) -> List[str]:
@@ -115,11 +127,12 @@ class AlarmValidator:
     Concurrency Model:
     - Sequential by region: Processes one region at a time
     - Concurrent within region: Fetches alarm data/history using ThreadPoolExecutor (max_workers=10)
-    - Sequential validation: After data fetch, validates each alarm sequentially
+    - Concurrent validation: After data fetch, validates alarms concurrently
+      (max_workers=10), reporting results in input order
 
     Example flow for 4 alarms in us-west-2 and 2 in us-east-1:
-    1. us-west-2: Fetch all 4 alarms concurrently → Validate sequentially
-    2. us-east-1: Fetch all 2 alarms concurrently → Validate sequentially
+    1. us-west-2: Fetch all 4 alarms concurrently → Validate concurrently
+    2. us-east-1: Fetch all 2 alarms concurrently → Validate concurrently
 
     Args:
         logger: CliLogger instance for debug output
@@ -183,12 +196,7 @@ class AlarmValidator:
                 region=region, alarm_arns=alarm_arns, result_map=history_map
             )
 
-        # Track which alarms were found as metric alarms
-        processed_arns = set()
-
-        for arn in alarm_arns:
-            self.ui.display_info(f"Processing {arn.split(':')[-1]}")
-
+        def validate(arn: str) -> ValidationResult:
             try:
                 alarm_data = alarm_data_map.get(arn)
                 history = history_map.get(arn, [])
@@ -197,23 +205,24 @@ class AlarmValidator:
                     # Try composite alarm
                     composite_result = self._try_composite_alarm(arn=arn, region=region)
                     if composite_result:
-                        results.append(composite_result)
-                        processed_arns.add(arn)
-                    else:
-                        results.append(
-                            self._create_error_result(arn=arn, error="Alarm not found")
-                        )
-                    continue
+                        return composite_result
+                    return self._create_error_result(arn=arn, error="Alarm not found")
 
-                result = self._validate_single_alarm(
+                return self._validate_single_alarm(
                     arn=arn, alarm_data=alarm_data, history=history
                 )
-                results.append(result)
-                processed_arns.add(arn)
 
             except Exception as e:
                 self.logger.error(f"Validation failed for {arn}: {e}")
-                results.append(self._create_error_result(arn=arn, error=str(e)))
+                return self._create_error_result(arn=arn, error=str(e))
+
+        # Each validation waits on its own GetMetricData (or composite
+        # DescribeAlarms) call, so run them concurrently; map keeps results
+        # in input order and progress is reported from this thread
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            for arn, result in zip(alarm_arns, executor.map(validate, alarm_arns)):
+                self.ui.display_info(f"Processing {arn.split(':')[-1]}")
+                results.append(result)
 
         return results
 
@@ -540,8 +549,7 @@ class AlarmValidator:
 
             # In CLI context, we'd use boto3 instead of k2_apis
             try:
-
-                cloudwatch = boto3.client("cloudwatch", region_name=region)
+                cloudwatch = self.alarm_accessor.get_client(region)
 
                 response = cloudwatch.get_metric_data(
                     MetricDataQueries=metric_queries,  # type: ignore[arg-type]
@@ -1259,25 +1267,45 @@ class AlarmValidator:
     def _batch_fetch_alarm_data(
         self, region: str, alarm_arns: List[str], result_map: Dict[str, Dict]
     ) -> None:
-        """Fetch alarm data concurrently with controlled parallelism."""
+        """Fetch alarm data with batched DescribeAlarms calls (100 names each).
 
-        @retry_on_throttle(max_retries=3, initial_backoff=1)
-        def fetch_single(arn: str) -> tuple[str, Optional[Dict]]:
+        A batch that fails is retried one name at a time, so a single bad
+        name only loses its own alarm rather than the rest of the batch.
+        """
+        arns_by_name: Dict[str, List[str]] = {}
+        for arn in alarm_arns:
             name = arn.split(":")[-1] if ":" in arn else arn
+            arns_by_name.setdefault(name, []).append(arn)
+
+        @retry_on_throttle(max_retries=3, initial_backoff=1)
+        def fetch_batch(names: List[str]) -> Dict[str, Any]:
+            return self.alarm_accessor.get_alarms_by_names(names=names, region=region)
+
+        @retry_on_throttle(max_retries=3, initial_backoff=1)
+        def fetch_single(name: str) -> Dict[str, Any]:
+            alarm = self.alarm_accessor.get_alarm_by_name(name=name, region=region)
+            return {name: alarm} if alarm else {}
+
+        names = list(arns_by_name)
+        alarms: Dict[str, Any] = {}
+        for start in range(0, len(names), DESCRIBE_ALARMS_MAX_RECORDS):
+            batch = names[start : start + DESCRIBE_ALARMS_MAX_RECORDS]
             try:
-                return arn, self.alarm_accessor.get_alarm_by_name(
-                    name=name, region=region
-                )
+                alarms.update(fetch_batch(batch))
             except Exception as e:
-                self.logger.error(f"Failed to fetch {name}: {e}")
-                return arn, None
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(fetch_single, arn): arn for arn in alarm_arns}
-            for future in as_completed(futures):
-                arn, data = future.result()
-                if data:
-                    result_map[arn] = data
+                self.logger.debug(
+                    f"Batch alarm fetch failed in {region}, "
+                    f"retrying names individually: {e}"
+                )
+                for name in batch:
+                    try:
+                        alarms.update(fetch_single(name))
+                    except Exception as single_error:
+                        self.logger.error(f"Failed to fetch {name}: {single_error}")
+
+        for name, alarm in alarms.items():
+            for arn in arns_by_name.get(name, []):
+                result_map[arn] = alarm
 
     def _batch_fetch_alarm_history(
         self, region: str, alarm_arns: List[str], result_map: Dict[str, List[Dict]]